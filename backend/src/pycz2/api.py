@@ -22,14 +22,18 @@ from .core.models import (
     ZoneTemperatureArgs,
 )
 from .mqtt import get_mqtt_client
+from .responses import ORJSONResponse
 from .sse import get_sse_manager, create_sse_response
-from .hvac_service import get_hvac_service, shutdown_hvac_service
+from .hvac_service import get_hvac_service, shutdown_hvac_service, spawn_tracked
 
 log = logging.getLogger(__name__)
 audit = logging.getLogger("pycz2.audit")
 
 # Global state to hold the background task
-background_tasks = set()
+background_tasks: set[asyncio.Task[None]] = set()
+
+# Fire-and-forget MQTT audit publishes, referenced until they finish
+audit_tasks: set[asyncio.Task[None]] = set()
 
 
 def _is_truthy(value: str | None) -> bool:
@@ -47,10 +51,18 @@ def _get_caller(request: Request) -> str:
 
 
 def _status_payload(
-    status: SystemStatus | None, include_raw: bool = False, flat: bool = False
+    status: SystemStatus | None,
+    include_raw: bool = False,
+    flat: bool = False,
+    now: int | None = None,
 ) -> dict[str, Any]:
     """Convert SystemStatus to dictionary payload."""
-    return status.to_dict(include_raw=include_raw, flat=flat) if status else {}
+    return status.to_dict(include_raw=include_raw, flat=flat, now=now) if status else {}
+
+
+def current_unix_time() -> int:
+    """Timestamp for flat payloads; a dependency so tests can pin the clock."""
+    return int(time.time())
 
 
 async def _execute_and_respond(
@@ -66,13 +78,13 @@ async def _execute_and_respond(
     status_obj, meta = await service.get_status(force_refresh=False)
     audit.info("command=%s caller=%s args=%s", operation, caller, kwargs)
     if settings.MQTT_ENABLED:
-        asyncio.create_task(get_mqtt_client().publish_audit({
+        spawn_tracked(get_mqtt_client().publish_audit({
             "event": "command",
             "timestamp": datetime.now(timezone.utc).astimezone().isoformat(),
             "caller": caller,
             "command": operation,
             "args": kwargs,
-        }))
+        }), audit_tasks)
 
     return {
         "status": _status_payload(status_obj),
@@ -121,9 +133,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             finally:
                 await cache.unsubscribe(queue)
 
-        task = asyncio.create_task(mqtt_publisher_task())
-        background_tasks.add(task)
-        task.add_done_callback(background_tasks.discard)
+        spawn_tracked(mqtt_publisher_task(), background_tasks)
 
     yield
     # Shutdown
@@ -141,6 +151,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         task.cancel()
     if background_tasks:
         await asyncio.gather(*background_tasks, return_exceptions=True)
+    if audit_tasks:
+        await asyncio.gather(*audit_tasks, return_exceptions=True)
 
     if settings.MQTT_ENABLED:
         mqtt_client = get_mqtt_client()
@@ -173,12 +185,13 @@ app.add_middleware(
 )
 
 
-@app.get("/status")
+@app.get("/status", response_class=ORJSONResponse)
 async def get_current_status(
     request: Request,
     client: ComfortZoneIIClient = Depends(get_client),
     lock: asyncio.Lock = Depends(get_lock),
-) -> dict[str, Any]:
+    now: int = Depends(current_unix_time),
+) -> ORJSONResponse:
     """
     Get the current system status.
 
@@ -197,12 +210,16 @@ async def get_current_status(
         )
 
         if use_flat_format:
-            return _status_payload(status, include_raw=raw_requested, flat=True)
+            return ORJSONResponse(
+                _status_payload(
+                    status, include_raw=raw_requested, flat=True, now=now
+                )
+            )
         else:
-            return {
+            return ORJSONResponse({
                 "status": _status_payload(status, include_raw=raw_requested),
                 "meta": meta.to_dict(),
-            }
+            })
     else:
         # Legacy behavior: direct query
         async with lock, client.connection():
@@ -210,16 +227,20 @@ async def get_current_status(
                 status = await client.get_status_data(include_raw=raw_requested)
 
                 if use_flat_format:
-                    return _status_payload(status, include_raw=raw_requested, flat=True)
+                    return ORJSONResponse(
+                        _status_payload(
+                            status, include_raw=raw_requested, flat=True, now=now
+                        )
+                    )
                 else:
-                    return {
+                    return ORJSONResponse({
                         "status": _status_payload(status, include_raw=raw_requested),
                         "meta": {
                             "connected": True,
                             "is_stale": False,
                             "source": "direct",
                         },
-                    }
+                    })
             except (TimeoutError, ConnectionAbortedError) as e:
                 log.error(f"Failed to get status: {e}")
                 raise HTTPException(
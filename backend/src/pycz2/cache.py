@@ -19,7 +19,7 @@ from .core.constants import SystemMode, FanMode
 log = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheMeta:
     """Metadata about the cached state."""
     connected: bool = False
@@ -116,14 +116,18 @@ class StateCache:
         except Exception as e:
             log.error(f"Failed to load from database: {e}")
 
-    async def _persist_to_database(self) -> None:
+    def _dump_status(self) -> Optional[dict[str, Any]]:
+        """Serialize the current status (with raw) once per cache write."""
+        return self._status.to_dict(include_raw=True) if self._status else None
+
+    async def _persist_to_database(
+        self, status_dict: Optional[dict[str, Any]] = None
+    ) -> None:
         """Persist current state to database."""
         try:
-            status_json = (
-                json.dumps(self._status.to_dict(include_raw=True))
-                if self._status
-                else None
-            )
+            if status_dict is None:
+                status_dict = self._dump_status()
+            status_json = json.dumps(status_dict) if status_dict else None
             meta_json = json.dumps(asdict(self._meta))
 
             async with aiosqlite.connect(self.db_path) as db:
@@ -200,11 +204,14 @@ class StateCache:
             self._meta.last_update_ts = time.time()
             self._meta.source = source
 
+            # Serialize once for both the database and subscribers
+            status_dict = self._dump_status()
+
             # Persist to database
-            await self._persist_to_database()
+            await self._persist_to_database(status_dict)
 
             # Notify subscribers
-            await self._notify_subscribers()
+            await self._notify_subscribers(status_dict)
 
             log.info(
                 f"Cache updated: version={self._meta.version}, "
@@ -225,18 +232,19 @@ class StateCache:
                 log.warning("Cannot apply partial update to empty cache")
                 return
 
-            # Create a copy and apply updates
-            status_dict = self._status.to_dict(include_raw=True)
-            status_dict.update(updates)
-
+            # Shallow merge: untouched fields (including zones) keep their
+            # existing objects; only the updated fields are validated anew
             try:
-                self._status = SystemStatus(**status_dict)
+                self._status = SystemStatus.model_validate(
+                    {**dict(self._status), **updates}
+                )
                 self._meta.version += 1
                 self._meta.last_update_ts = time.time()
                 self._meta.source = source
 
-                await self._persist_to_database()
-                await self._notify_subscribers()
+                status_dict = self._dump_status()
+                await self._persist_to_database(status_dict)
+                await self._notify_subscribers(status_dict)
 
                 log.debug(f"Applied partial update: {updates}")
             except ValidationError as e:
@@ -274,14 +282,25 @@ class StateCache:
         """Unsubscribe from cache updates."""
         self._subscribers.discard(queue)
 
-    async def _notify_subscribers(self) -> None:
-        """Notify all subscribers of cache update."""
+    async def _notify_subscribers(
+        self, status_dict: Optional[dict[str, Any]] = None
+    ) -> None:
+        """
+        Notify all subscribers of cache update.
+
+        Args:
+            status_dict: The status already serialized with raw data (as
+                persisted); reused minus the raw blob instead of dumping again
+        """
         if not self._subscribers:
             return
 
-        status = self._status or self.get_empty_status()
+        if status_dict is not None:
+            status_data = {k: v for k, v in status_dict.items() if k != "raw"}
+        else:
+            status_data = (self._status or self.get_empty_status()).to_dict()
         update = {
-            "status": status.to_dict(),
+            "status": status_data,
             "meta": self._meta.to_dict()
         }
 
@@ -3,7 +3,7 @@ import asyncio
 import base64
 import inspect
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Any
 from contextlib import asynccontextmanager
 from types import TracebackType
@@ -34,9 +34,20 @@ from .models import SystemStatus, ZoneStatus
 
 log = logging.getLogger(__name__)
 
+# Signature of asyncio.open_connection(host, port)
+Connector = Callable[
+    [str, int], Awaitable[tuple[asyncio.StreamReader, asyncio.StreamWriter]]
+]
+
 
 class ComfortZoneIIClient:
-    def __init__(self, connect_str: str, zone_count: int, device_id: int = 99):
+    def __init__(
+        self,
+        connect_str: str,
+        zone_count: int,
+        device_id: int = 99,
+        connector: Connector | None = None,
+    ):
         self.connect_str = connect_str
         self.zone_count = zone_count
         self.device_id = device_id
@@ -44,6 +55,8 @@ class ComfortZoneIIClient:
         self.writer: asyncio.StreamWriter | None = None
         self._buffer = b""
         self._is_serial = ":" not in self.connect_str
+        # Opens the TCP stream; injectable so tests don't patch asyncio
+        self._connector: Connector = connector or asyncio.open_connection
 
     async def connect(self) -> None:
         if self.is_connected():
@@ -80,7 +93,7 @@ class ComfortZoneIIClient:
                 # Add timeout to prevent hanging on unreachable hosts
                 try:
                     self.reader, self.writer = await asyncio.wait_for(
-                        asyncio.open_connection(host, port),
+                        self._connector(host, port),
                         timeout=3.0,
                     )
                     sock = self.writer.get_extra_info("socket")
@@ -428,7 +441,9 @@ class ComfortZoneIIClient:
         else:
             outside_temp_val = two_byte_temp
 
-        status = SystemStatus(
+        # Every field below is already typed by the decoder (ints, bools,
+        # enum members from the lookup maps), so skip Pydantic validation
+        status = SystemStatus.model_construct(
             system_time=system_time,
             system_mode=SYSTEM_MODE_MAP.get(s_mode, SystemMode.OFF),
             effective_mode=effective_mode_val,
@@ -459,7 +474,7 @@ class ComfortZoneIIClient:
             zone_id = i + 1
             bit = 1 << i
             damper_raw = safe_get(data_9_4, i + 3)
-            zone = ZoneStatus(
+            zone = ZoneStatus.model_construct(
                 zone_id=zone_id,
                 damper_position=(round(damper_raw / DAMPER_DIVISOR * 100)
                                 if damper_raw > 0 and DAMPER_DIVISOR > 0 else 0),
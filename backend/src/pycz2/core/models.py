@@ -1,11 +1,20 @@
 # src/pycz2/core/models.py
 
+import json
+import time
 from typing import Any
 
 from pydantic import BaseModel, Field, model_validator
 
 from .constants import FanMode, SystemMode
 
+# Damper positions are percentages; reuse "0".."100" instead of str() per zone
+_DAMPER_STR = tuple(str(i) for i in range(101))
+
+
+def _damper_str(position: int) -> str:
+    return _DAMPER_STR[position] if 0 <= position <= 100 else str(position)
+
 
 class ZoneStatus(BaseModel):
     zone_id: int
@@ -39,32 +48,46 @@ class SystemStatus(BaseModel):
     raw: str | None = None
     zones: list[ZoneStatus]
 
-    def to_dict(self, include_raw: bool = False, flat: bool = False) -> dict[str, Any]:
+    def to_dict(
+        self, include_raw: bool = False, flat: bool = False, now: int | None = None
+    ) -> dict[str, Any]:
         """
         Convert SystemStatus to dictionary.
 
         Args:
             include_raw: Include raw HVAC data blob
             flat: Apply legacy flat format transformations for backwards compatibility
+            now: Unix timestamp for the flat "time" field (defaults to current time)
         """
-        import time as time_module
+        if not flat:
+            exclude = None if include_raw else {"raw"}
+            return self.model_dump(exclude=exclude, exclude_none=True)
 
-        exclude = None if include_raw else {"raw"}
+        # Flat: dump the top level without zones, then build each zone in its
+        # final legacy shape so nothing is walked a second time
+        exclude = {"zones"} if include_raw else {"raw", "zones"}
         data = self.model_dump(exclude=exclude, exclude_none=True)
 
-        if flat:
-            # Parity Requirement 2: Convert all_mode boolean to numeric (0/1)
-            # Integers 1-8 pass through unchanged (future-proof)
-            if isinstance(data.get("all_mode"), bool):
-                data["all_mode"] = 1 if data["all_mode"] else 0
+        # Parity Requirement 1: modes as plain legacy strings ("Heat", "EHeat")
+        data["system_mode"] = self.system_mode.value
+        data["effective_mode"] = self.effective_mode.value
+        data["fan_mode"] = self.fan_mode.value
+
+        # Parity Requirement 2: Convert all_mode boolean to numeric (0/1)
+        # Integers 1-8 pass through unchanged (future-proof)
+        if isinstance(data.get("all_mode"), bool):
+            data["all_mode"] = 1 if data["all_mode"] else 0
 
-            # Parity Requirement 3: Add time field (Unix timestamp)
-            data["time"] = int(time_module.time())
+        # Parity Requirement 4: damper_position as string in all zones.
+        # Zone fields are all plain ints/bools, so copying the validated
+        # field values skips a model_dump() per zone.
+        data["zones"] = [
+            {**zone.__dict__, "damper_position": _damper_str(zone.damper_position)}
+            for zone in self.zones
+        ]
 
-            # Parity Requirement 4: Convert damper_position to string in all zones
-            for zone in data.get("zones", []):
-                if "damper_position" in zone:
-                    zone["damper_position"] = str(zone["damper_position"])
+        # Parity Requirement 3: Add time field (Unix timestamp)
+        data["time"] = int(time.time()) if now is None else now
 
         return data
 
@@ -78,8 +101,6 @@ class SystemStatus(BaseModel):
         """
         # Use to_dict for flat transformations, then serialize to JSON
         if flat:
-            import json
-
             data = self.to_dict(include_raw=include_raw, flat=True)
             return json.dumps(data, **kwargs)
         else:
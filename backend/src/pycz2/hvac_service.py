@@ -8,15 +8,15 @@ This service replaces the persistent worker with a proven pattern:
 - All operations serialized through a single lock
 """
 import asyncio
-import contextlib
 import logging
 import time
+from collections.abc import Awaitable, Callable, Coroutine
 from datetime import datetime, timezone
 from typing import Any, Optional, Tuple
 
-from .cache import get_cache, CacheMeta
+from .cache import get_cache, CacheMeta, StateCache
 from .config import settings
-from .core.client import get_client, get_lock
+from .core.client import ComfortZoneIIClient, get_client, get_lock
 from .core.models import SystemStatus
 from .mqtt import get_mqtt_client
 
@@ -24,6 +24,53 @@ log = logging.getLogger(__name__)
 audit = logging.getLogger("pycz2.audit")
 
 
+# Optional set_zone_setpoints arguments forwarded only when provided
+_SETPOINT_OPTIONS = (
+    "heat_setpoint", "cool_setpoint", "temporary_hold", "hold", "out_mode",
+)
+
+
+async def _set_system_mode(client: ComfortZoneIIClient, kwargs: dict[str, Any]) -> None:
+    await client.set_system_mode(
+        mode=kwargs.get("mode"), all_zones_mode=kwargs.get("all_zones", None),
+    )
+
+
+async def _set_fan_mode(client: ComfortZoneIIClient, kwargs: dict[str, Any]) -> None:
+    await client.set_fan_mode(kwargs["fan_mode"])
+
+
+async def _set_zone_setpoints(
+    client: ComfortZoneIIClient, kwargs: dict[str, Any]
+) -> None:
+    setpoint_kwargs: dict[str, Any] = {"zones": kwargs["zones"]}
+    for key in _SETPOINT_OPTIONS:
+        value = kwargs.get(key)
+        if value is not None:
+            setpoint_kwargs[key] = value
+    await client.set_zone_setpoints(**setpoint_kwargs)
+
+
+# Operation name -> client call, resolved once per execute_command
+_OPERATIONS: dict[
+    str, Callable[[ComfortZoneIIClient, dict[str, Any]], Awaitable[None]]
+] = {
+    "set_system_mode": _set_system_mode,
+    "set_fan_mode": _set_fan_mode,
+    "set_zone_setpoints": _set_zone_setpoints,
+}
+
+
+def spawn_tracked(
+    coro: Coroutine[Any, Any, None], tasks: set[asyncio.Task[None]]
+) -> asyncio.Task[None]:
+    """Run a fire-and-forget coroutine, holding a reference in tasks until done."""
+    task = asyncio.create_task(coro)
+    tasks.add(task)
+    task.add_done_callback(tasks.discard)
+    return task
+
+
 class HVACService:
     """Service for HVAC operations using CLI-style connect/execute/disconnect pattern."""
 
@@ -32,9 +79,17 @@ class HVACService:
         self._op_lock = get_lock()  # Serialize all HVAC bus access
         self._refresh_task: Optional[asyncio.Task[None]] = None
         self._stop_event = asyncio.Event()
-        self._last_refresh_time = 0
+        self._last_refresh_time = 0.0  # time.monotonic() of last success
         self._consecutive_errors = 0
         self._max_consecutive_errors = 5
+        # Fire-and-forget side effects (MQTT audit) kept alive until done
+        self._pending_tasks: set[asyncio.Task[None]] = set()
+        # Resolved on first use; the cache is a process-wide singleton
+        self._cache: Optional[StateCache] = None
+        # In-flight stale-cache refresh shared by concurrent get_status callers
+        self._refresh_future: Optional[
+            asyncio.Future[Tuple[Optional[SystemStatus], CacheMeta]]
+        ] = None
 
     async def start(self):
         """Start the background refresh loop."""
@@ -48,11 +103,31 @@ class HVACService:
             log.info("Stopping HVAC service background refresh loop")
             self._stop_event.set()
             self._refresh_task.cancel()
-            with contextlib.suppress(Exception):
-                await self._refresh_task
+            # gather() absorbs the task's CancelledError (a BaseException)
+            # so it never escapes stop() when the cancel lands outside the
+            # loop's own handler, e.g. during the initial delay
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
             self._refresh_task = None
             self._stop_event.clear()
 
+        # Let an in-flight shared refresh and any audit publishes finish
+        # before the caller tears down the bus client or MQTT connection
+        pending = [*self._pending_tasks]
+        if self._refresh_future is not None:
+            pending.append(self._refresh_future)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _get_cache(self) -> StateCache:
+        """Return the shared state cache, resolving it once per service."""
+        if self._cache is None:
+            self._cache = await get_cache()
+        return self._cache
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a side effect off the HVAC path, holding a reference until done."""
+        spawn_tracked(coro, self._pending_tasks)
+
     async def get_status(
         self,
         force_refresh: bool = False,
@@ -67,7 +142,7 @@ class HVACService:
         Returns:
             Tuple of (SystemStatus or None, CacheMeta)
         """
-        cache = await get_cache()
+        cache = await self._get_cache()
 
         # Always get current cache state first
         status, meta = await cache.get()
@@ -88,11 +163,31 @@ class HVACService:
         log.info(
             f"Fetching fresh status (force={force_refresh}, stale={meta.is_stale()}, raw={include_raw})"
         )
-        return await self._refresh_once(
-            source="force" if force_refresh else "auto",
-            include_raw=include_raw,
-            raise_on_error=force_refresh,
-        )
+        if force_refresh or include_raw:
+            return await self._refresh_once(
+                source="force" if force_refresh else "auto",
+                include_raw=include_raw,
+                raise_on_error=force_refresh,
+            )
+        return await self._shared_refresh()
+
+    async def _shared_refresh(self) -> Tuple[Optional[SystemStatus], CacheMeta]:
+        """
+        Refresh a stale cache once for all concurrent callers.
+
+        The first caller starts the bus read; later callers await the same
+        future instead of queueing their own read behind the HVAC lock.
+        """
+        if self._refresh_future is None:
+            future = asyncio.ensure_future(self._refresh_once(source="auto"))
+            future.add_done_callback(self._clear_refresh_future)
+            self._refresh_future = future
+        # Shielded so one caller going away doesn't cancel the others' read
+        return await asyncio.shield(self._refresh_future)
+
+    def _clear_refresh_future(self, future: asyncio.Future[Any]) -> None:
+        if self._refresh_future is future:
+            self._refresh_future = None
 
     async def execute_command(self, operation: str, **kwargs: Any) -> SystemStatus:
         """
@@ -103,8 +198,12 @@ class HVACService:
         """
         log.info(f"Executing command: {operation} with args: {kwargs}")
 
+        handler = _OPERATIONS.get(operation)
+        if handler is None:
+            raise ValueError(f"Unknown operation: {operation}")
+
         client = get_client()
-        cache = await get_cache()
+        cache = await self._get_cache()
 
         started_at = time.monotonic()
         lock_acquired_at: float | None = None
@@ -140,27 +239,7 @@ class HVACService:
                 async with client.connection():
                     connection_entered_at = time.monotonic()
 
-                    if operation == "set_system_mode":
-                        mode = kwargs.get("mode")
-                        all_zones = kwargs.get("all_zones", None)
-                        await client.set_system_mode(
-                            mode=mode, all_zones_mode=all_zones,
-                        )
-                    elif operation == "set_fan_mode":
-                        await client.set_fan_mode(kwargs["fan_mode"])
-                    elif operation == "set_zone_setpoints":
-                        zones = kwargs["zones"]
-                        setpoint_kwargs: dict[str, Any] = {"zones": zones}
-                        for key in (
-                            "heat_setpoint", "cool_setpoint",
-                            "temporary_hold", "hold", "out_mode",
-                        ):
-                            value = kwargs.get(key)
-                            if value is not None:
-                                setpoint_kwargs[key] = value
-                        await client.set_zone_setpoints(**setpoint_kwargs)
-                    else:
-                        raise ValueError(f"Unknown operation: {operation}")
+                    await handler(client, kwargs)
 
                     status_fetch_started_at = time.monotonic()
                     log.debug("Fetching fresh status after command")
@@ -201,7 +280,7 @@ class HVACService:
     ) -> Tuple[Optional[SystemStatus], CacheMeta]:
         """Perform a single refresh operation with separate lock/command timeouts."""
         client = get_client()
-        cache = await get_cache()
+        cache = await self._get_cache()
         started_at = time.monotonic()
 
         # Step 1: Acquire lock with its own timeout
@@ -256,7 +335,7 @@ class HVACService:
                                 source,
                             )
                             if settings.MQTT_ENABLED:
-                                asyncio.create_task(get_mqtt_client().publish_audit({
+                                self._spawn(get_mqtt_client().publish_audit({
                                     "event": "unexpected_change",
                                     "timestamp": datetime.now(timezone.utc).astimezone().isoformat(),
                                     "zone": i + 1,
@@ -265,10 +344,10 @@ class HVACService:
 
             await cache.update(status, source=source)
             self._consecutive_errors = 0
-            self._last_refresh_time = time.time()
+            self._last_refresh_time = now = time.monotonic()
             log.info(
                 "Refresh successful (source=%s, elapsed=%.3fs)",
-                source, time.monotonic() - started_at,
+                source, now - started_at,
             )
 
         except Exception as e:
@@ -324,23 +403,23 @@ class HVACService:
 
 # Global service instance (singleton pattern like cache/sse)
 _service: Optional[HVACService] = None
-_service_lock = asyncio.Lock()
 
 
 async def get_hvac_service() -> HVACService:
     """
     Get the global HVAC service instance (singleton).
 
+    No lock is needed: neither HVACService() nor start() awaits, so the
+    check-and-create below cannot be interleaved with another caller.
+
     Returns:
         The HVAC service instance
     """
     global _service
 
     if _service is None:
-        async with _service_lock:
-            if _service is None:
-                _service = HVACService()
-                await _service.start()
+        _service = HVACService()
+        await _service.start()
 
     return _service
 
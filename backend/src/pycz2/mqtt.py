@@ -1,10 +1,10 @@
 # src/pycz2/mqtt.py
 import asyncio
-import json
 import logging
 from typing import Any
 
 import aiomqtt as mqtt
+import orjson
 
 from .config import settings
 from .core.models import SystemStatus
@@ -42,7 +42,8 @@ class MqttClient:
         if not settings.MQTT_ENABLED:
             return
 
-        payload = status.to_json(flat=True)
+        # Encode straight to bytes; aiomqtt publishes them without re-encoding
+        payload = orjson.dumps(status.to_dict(flat=True))
         published = False
 
         async with self._lock:
@@ -71,7 +72,7 @@ class MqttClient:
         if not settings.MQTT_ENABLED:
             return
 
-        data = json.dumps(payload)
+        data = orjson.dumps(payload)
 
         async with self._lock:
             try:
@@ -0,0 +1,21 @@
+# src/pycz2/responses.py
+"""
+Response classes for the API.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Handlers return a ready-made dict (e.g. SystemStatus.to_dict()), so
+    FastAPI's jsonable_encoder pass is skipped. orjson encodes Enum and
+    datetime values natively. FastAPI's own ORJSONResponse is deprecated.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -32,7 +32,7 @@ class EventType(Enum):
     META = "meta"            # Metadata update only
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscriberInfo:
     """Information about an SSE subscriber."""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -305,54 +305,54 @@ class SSEManager:
             # Subscribe to cache updates
             cache_queue = await cache.subscribe()
 
+            # One pending get() per queue, re-armed only after it completes,
+            # so an idle stream sleeps until there is something to send.
+            # sse-starlette cancels this generator when the client goes away.
+            subscriber_get = asyncio.create_task(subscriber.queue.get())
+            cache_get = asyncio.create_task(cache_queue.get())
+
             try:
                 while True:
-                    # Use asyncio.wait with timeout to handle both queues
-                    tasks = [
-                        asyncio.create_task(subscriber.queue.get()),
-                        asyncio.create_task(cache_queue.get())
-                    ]
-
-                    done, pending = await asyncio.wait(
-                        tasks,
+                    done, _ = await asyncio.wait(
+                        (subscriber_get, cache_get),
                         return_when=asyncio.FIRST_COMPLETED,
-                        timeout=1.0  # Check for disconnection every second
                     )
 
-                    # Cancel pending tasks
-                    for task in pending:
-                        task.cancel()
-
-                    # Process completed tasks
-                    for task in done:
-                        try:
-                            result = task.result()
-
-                            # Check for shutdown signal
-                            if result is None:
-                                return
-
-                            # Handle SSE event
-                            if isinstance(result, dict) and "event" in result:
-                                yield result
-                            # Handle cache update
-                            elif isinstance(result, dict) and "status" in result:
-                                yield {
-                                    "event": EventType.STATE.value,
-                                    "id": await self._get_next_event_id(),
-                                    "data": json.dumps(result)
-                                }
-
-                        except asyncio.CancelledError:
-                            pass
-                        except Exception as e:
-                            log.error(f"Error processing event: {e}")
+                    if subscriber_get in done:
+                        result = subscriber_get.result()
+
+                        # Check for shutdown signal
+                        if result is None:
+                            return
+
+                        # Handle SSE event
+                        if isinstance(result, dict) and "event" in result:
+                            yield result
+                        subscriber_get = asyncio.create_task(subscriber.queue.get())
+
+                    if cache_get in done:
+                        result = cache_get.result()
+                        # Each cache update is a full snapshot, so a burst
+                        # (e.g. several setpoint writes) collapses to one event
+                        while not cache_queue.empty():
+                            result = cache_queue.get_nowait()
+
+                        # Handle cache update
+                        if isinstance(result, dict) and "status" in result:
+                            yield {
+                                "event": EventType.STATE.value,
+                                "id": await self._get_next_event_id(),
+                                "data": json.dumps(result)
+                            }
+                        cache_get = asyncio.create_task(cache_queue.get())
 
                     # Check if client disconnected
                     if await request.is_disconnected():
                         break
 
             finally:
+                subscriber_get.cancel()
+                cache_get.cancel()
                 # Unsubscribe from cache
                 await cache.unsubscribe(cache_queue)
 
@@ -376,23 +376,25 @@ class SSEManager:
 
 # Global SSE manager instance
 _sse_manager: Optional[SSEManager] = None
-_sse_lock = asyncio.Lock()
 
 
 async def get_sse_manager() -> SSEManager:
-    """Get or create the global SSE manager instance."""
+    """
+    Get or create the global SSE manager instance.
+
+    Construction and start() never await, so no lock is needed around
+    the check-and-create.
+    """
     global _sse_manager
 
     if _sse_manager is None:
-        async with _sse_lock:
-            if _sse_manager is None:
-                _sse_manager = SSEManager(
-                    max_subscribers=settings.SSE_MAX_SUBSCRIBERS_PER_IP * 20,
-                    max_subscribers_per_ip=settings.SSE_MAX_SUBSCRIBERS_PER_IP,
-                    heartbeat_interval=settings.SSE_HEARTBEAT_INTERVAL,
-                    enable_compression=True
-                )
-                await _sse_manager.start()
+        _sse_manager = SSEManager(
+            max_subscribers=settings.SSE_MAX_SUBSCRIBERS_PER_IP * 20,
+            max_subscribers_per_ip=settings.SSE_MAX_SUBSCRIBERS_PER_IP,
+            heartbeat_interval=settings.SSE_HEARTBEAT_INTERVAL,
+            enable_compression=True
+        )
+        await _sse_manager.start()
 
     return _sse_manager
 
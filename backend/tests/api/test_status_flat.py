@@ -14,117 +14,169 @@ Parity Requirements (all tests should FAIL initially):
 """
 
 import asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient, Request, Response
 
-from pycz2.api import app
+from pycz2 import hvac_service
+from pycz2.api import app, current_unix_time
+from pycz2.cache import get_cache
 from pycz2.core.client import ComfortZoneIIClient, get_client, get_lock
 from pycz2.core.constants import FanMode, SystemMode
 from pycz2.core.models import SystemStatus, ZoneStatus
+from pycz2.hvac_service import HVACService, shutdown_hvac_service
 from pycz2.mqtt import MqttClient, get_mqtt_client
 
+# Keep this module's tests on one xdist worker: they share the class-scoped
+# app overrides and the process-wide HVAC service/cache singletons
+pytestmark = pytest.mark.xdist_group("api_flat")
 
-@pytest.fixture
+
+def _json(response: Response):
+    """Decode a response body with orjson, the encoder /status ships with."""
+    return orjson.loads(response.content)
+
+
+# Every parity test issues this exact request; build it once
+_STATUS_FLAT_REQ = Request("GET", "http://test/status?flat=1")
+
+
+async def _get_flat(client: AsyncClient):
+    """GET /status?flat=1, assert success and return the decoded body."""
+    response = await client.send(_STATUS_FLAT_REQ)
+    assert response.status_code == 200
+    return _json(response)
+
+
+class _NoopAcm:
+    """Plain async context manager standing in for client.connection()."""
+
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+_NOOP_ACM = _NoopAcm()
+
+
+# App overrides and mocks are shared per test class; client_flat gives each
+# test a clean mock and an empty cache.
+
+
+# Mocks are unspecced and carry only the methods /status uses;
+# TestMockInterface guards against name drift.
+_CLIENT_METHODS = ("connection", "get_status_data")
+_MQTT_METHODS = ("publish_status",)
+
+
+@pytest.fixture(scope="class")
 def mock_client():
     """Create a mock ComfortZoneIIClient."""
-    client = AsyncMock(spec=ComfortZoneIIClient)
-    connection_cm = AsyncMock()
-    connection_cm.__aenter__.return_value = None
-    connection_cm.__aexit__.return_value = None
-    client.connection.return_value = connection_cm
+    client = AsyncMock()
+    client.connection = MagicMock(return_value=_NOOP_ACM)
+    client.get_status_data = AsyncMock()
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def mock_mqtt_client():
     """Create a mock MqttClient."""
-    mqtt_client = AsyncMock(spec=MqttClient)
+    mqtt_client = AsyncMock()
+    mqtt_client.publish_status = AsyncMock()
     return mqtt_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def mock_lock():
     """Create a real asyncio.Lock for testing."""
     return asyncio.Lock()
 
 
+# Legacy json_response.js sample, built once without validation. This is
+# what the HVAC returns internally (with enums), which flat=1 responses
+# must convert to the legacy format.
+_BASE_ZONES = (
+    ZoneStatus.model_construct(
+        zone_id=1,
+        temperature=47,
+        damper_position=100,  # Integer in model
+        cool_setpoint=85,
+        heat_setpoint=55,
+        temporary=False,
+        hold=True,
+        out=False,
+    ),
+    ZoneStatus.model_construct(
+        zone_id=2,
+        temperature=48,
+        damper_position=100,
+        cool_setpoint=85,
+        heat_setpoint=55,
+        temporary=False,
+        hold=True,
+        out=False,
+    ),
+    ZoneStatus.model_construct(
+        zone_id=3,
+        temperature=48,
+        damper_position=100,
+        cool_setpoint=85,
+        heat_setpoint=55,
+        temporary=False,
+        hold=True,
+        out=False,
+    ),
+    ZoneStatus.model_construct(
+        zone_id=4,
+        temperature=0,
+        damper_position=0,
+        cool_setpoint=85,
+        heat_setpoint=45,
+        temporary=False,
+        hold=True,
+        out=False,
+    ),
+)
+
+_BASE_STATUS = SystemStatus.model_construct(
+    system_time="Sun 12:52am",
+    system_mode=SystemMode.AUTO,
+    effective_mode=SystemMode.HEAT,
+    fan_mode=FanMode.AUTO,
+    fan_state="Off",
+    active_state="Idle",
+    all_mode=True,  # Boolean in model, should become 1 in flat response
+    outside_temp=-1,
+    air_handler_temp=52,
+    zone1_humidity=51,
+    compressor_stage_1=False,
+    compressor_stage_2=False,
+    aux_heat_stage_1=False,
+    aux_heat_stage_2=False,
+    humidify=False,
+    dehumidify=False,
+    reversing_valve=False,
+    raw=None,
+    zones=list(_BASE_ZONES),
+)
+
+
 @pytest.fixture
 def legacy_sample_status():
     """
-    Create a SystemStatus matching the legacy json_response.js structure.
+    Fresh shallow copy of the legacy sample status.
 
-    This fixture represents what the HVAC returns internally (with enums),
-    but needs to be converted to legacy format for flat=1 responses.
+    Tests mutate top-level fields (all_mode, system_mode, fan_mode), so each
+    gets its own copy; the zone models are shared and never mutated.
     """
-    zones = [
-        ZoneStatus(
-            zone_id=1,
-            temperature=47,
-            damper_position=100,  # Integer in model
-            cool_setpoint=85,
-            heat_setpoint=55,
-            temporary=False,
-            hold=True,
-            out=False,
-        ),
-        ZoneStatus(
-            zone_id=2,
-            temperature=48,
-            damper_position=100,
-            cool_setpoint=85,
-            heat_setpoint=55,
-            temporary=False,
-            hold=True,
-            out=False,
-        ),
-        ZoneStatus(
-            zone_id=3,
-            temperature=48,
-            damper_position=100,
-            cool_setpoint=85,
-            heat_setpoint=55,
-            temporary=False,
-            hold=True,
-            out=False,
-        ),
-        ZoneStatus(
-            zone_id=4,
-            temperature=0,
-            damper_position=0,
-            cool_setpoint=85,
-            heat_setpoint=45,
-            temporary=False,
-            hold=True,
-            out=False,
-        ),
-    ]
-
-    return SystemStatus(
-        system_time="Sun 12:52am",
-        system_mode=SystemMode.AUTO,
-        effective_mode=SystemMode.HEAT,
-        fan_mode=FanMode.AUTO,
-        fan_state="Off",
-        active_state="Idle",
-        all_mode=True,  # Boolean in model, should become 1 in flat response
-        outside_temp=-1,
-        air_handler_temp=52,
-        zone1_humidity=51,
-        compressor_stage_1=False,
-        compressor_stage_2=False,
-        aux_heat_stage_1=False,
-        aux_heat_stage_2=False,
-        humidify=False,
-        dehumidify=False,
-        reversing_valve=False,
-        raw=None,
-        zones=zones,
-    )
+    return _BASE_STATUS.model_copy(update={"zones": list(_BASE_ZONES)})
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def test_app_flat(mock_client, mock_mqtt_client, mock_lock):
     """Create a FastAPI test app with mocked dependencies."""
     app.dependency_overrides[get_client] = lambda: mock_client
@@ -134,31 +186,46 @@ def test_app_flat(mock_client, mock_mqtt_client, mock_lock):
     async def noop(*args, **kwargs):
         return None
 
-    hvac_client_patch = patch("pycz2.hvac_service.get_client", lambda: mock_client)
-    hvac_start_patch = patch("pycz2.hvac_service.HVACService.start", noop)
-    hvac_stop_patch = patch("pycz2.hvac_service.HVACService.stop", noop)
-
-    with (
-        hvac_client_patch,
-        hvac_start_patch,
-        hvac_stop_patch,
-    ):
+    # The monkeypatch fixture is function-scoped; use its context form here
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(hvac_service, "get_client", lambda: mock_client)
+        mp.setattr(HVACService, "start", noop)
+        mp.setattr(HVACService, "stop", noop)
         yield app
 
     app.dependency_overrides.clear()
 
 
 @pytest.fixture
-def client_flat(test_app_flat):
-    """Create a TestClient for the FastAPI app."""
-    with TestClient(test_app_flat) as test_client:
-        # Clear cache before each test to avoid interference
-        try:
-            test_client.post("/cache/clear")
-            # Ignore errors if cache not available
-        except Exception:
-            pass
-        yield test_client
+async def client_flat(test_app_flat, mock_client):
+    """
+    In-process ASGI client for the app, with a clean mock and empty cache.
+
+    ASGITransport doesn't run the lifespan; the HVAC service and cache are
+    created lazily by /status, and the service is dropped after each test.
+    """
+    mock_client.reset_mock()
+    try:
+        await (await get_cache()).clear()
+        # Ignore errors if cache not available
+    except Exception:
+        pass
+
+    transport = ASGITransport(app=test_app_flat)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+    await shutdown_hvac_service()
+
+
+class TestMockInterface:
+    """The unspecced mocks must mirror real client/MQTT methods."""
+
+    def test_mock_methods_exist_on_real_classes(self):
+        for name in _CLIENT_METHODS:
+            assert callable(getattr(ComfortZoneIIClient, name, None)), name
+        for name in _MQTT_METHODS:
+            assert callable(getattr(MqttClient, name, None)), name
 
 
 class TestStatusFlatParity:
@@ -168,7 +235,7 @@ class TestStatusFlatParity:
     ALL TESTS IN THIS CLASS SHOULD FAIL INITIALLY (Red phase).
     """
 
-    def test_system_mode_enum_to_title_case_string(
+    async def test_system_mode_enum_to_title_case_string(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """
@@ -179,9 +246,7 @@ class TestStatusFlatParity:
         """
         mock_client.get_status_data.return_value = legacy_sample_status
 
-        response = client_flat.get("/status?flat=1")
-        assert response.status_code == 200
-        data = response.json()
+        data = await _get_flat(client_flat)
 
         # Verify system_mode is title-case string
         assert "system_mode" in data, "system_mode field missing"
@@ -201,7 +266,7 @@ class TestStatusFlatParity:
             f"Expected 'Heat', got '{data['effective_mode']}'"
         )
 
-    def test_fan_mode_enum_to_title_case_string(
+    async def test_fan_mode_enum_to_title_case_string(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """
@@ -212,9 +277,7 @@ class TestStatusFlatParity:
         """
         mock_client.get_status_data.return_value = legacy_sample_status
 
-        response = client_flat.get("/status?flat=1")
-        assert response.status_code == 200
-        data = response.json()
+        data = await _get_flat(client_flat)
 
         # Verify fan_mode is title-case string
         assert "fan_mode" in data, "fan_mode field missing"
@@ -223,7 +286,7 @@ class TestStatusFlatParity:
         )
         assert data["fan_mode"] == "Auto", f"Expected 'Auto', got '{data['fan_mode']}'"
 
-    def test_all_mode_boolean_to_numeric(
+    async def test_all_mode_boolean_to_numeric(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """
@@ -236,9 +299,7 @@ class TestStatusFlatParity:
         legacy_sample_status.all_mode = True
         mock_client.get_status_data.return_value = legacy_sample_status
 
-        response = client_flat.get("/status?flat=1")
-        assert response.status_code == 200
-        data = response.json()
+        data = await _get_flat(client_flat)
 
         assert "all_mode" in data, "all_mode field missing"
         assert isinstance(data["all_mode"], int), (
@@ -246,7 +307,7 @@ class TestStatusFlatParity:
         )
         assert data["all_mode"] == 1, f"Expected 1 for True, got {data['all_mode']}"
 
-    def test_all_mode_false_to_zero(
+    async def test_all_mode_false_to_zero(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """
@@ -255,13 +316,11 @@ class TestStatusFlatParity:
         legacy_sample_status.all_mode = False
         mock_client.get_status_data.return_value = legacy_sample_status
 
-        response = client_flat.get("/status?flat=1")
-        assert response.status_code == 200
-        data = response.json()
+        data = await _get_flat(client_flat)
 
         assert data["all_mode"] == 0, f"Expected 0 for False, got {data['all_mode']}"
 
-    def test_all_mode_integer_unchanged(
+    async def test_all_mode_integer_unchanged(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """
@@ -277,7 +336,7 @@ class TestStatusFlatParity:
             # Note: May need to adjust model to accept int | bool (clarify)
             pass  # Placeholder - implement when model supports int
 
-    def test_time_field_present_and_integer(
+    async def test_time_field_present_and_integer(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """
@@ -288,22 +347,21 @@ class TestStatusFlatParity:
         """
         mock_client.get_status_data.return_value = legacy_sample_status
 
-        # Mock time.time() for deterministic testing
+        # Pin the clock through the dependency for deterministic testing
         expected_time = 1676180543
-        with patch("time.time", return_value=expected_time):
-            response = client_flat.get("/status?flat=1")
-
-        assert response.status_code == 200
-        data = response.json()
+        app.dependency_overrides[current_unix_time] = lambda: expected_time
+        try:
+            data = await _get_flat(client_flat)
+        finally:
+            del app.dependency_overrides[current_unix_time]
 
         assert "time" in data, "time field missing (clarify)"
         assert isinstance(data["time"], int), (
             f"time should be int, got {type(data.get('time'))}"
         )
-        # Should be close to current time (within reason)
-        assert data["time"] > 0, "time should be positive unix timestamp"
+        assert data["time"] == expected_time
 
-    def test_damper_position_as_string(
+    async def test_damper_position_as_string(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """
@@ -316,9 +374,7 @@ class TestStatusFlatParity:
         """
         mock_client.get_status_data.return_value = legacy_sample_status
 
-        response = client_flat.get("/status?flat=1")
-        assert response.status_code == 200
-        data = response.json()
+        data = await _get_flat(client_flat)
 
         assert "zones" in data, "zones field missing"
         assert len(data["zones"]) > 0, "Expected at least one zone"
@@ -338,7 +394,7 @@ class TestStatusFlatParity:
             f"Expected '0', got '{data['zones'][3]['damper_position']}'"
         )
 
-    def test_response_structure_matches_legacy(
+    async def test_response_structure_matches_legacy(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """
@@ -348,9 +404,7 @@ class TestStatusFlatParity:
         """
         mock_client.get_status_data.return_value = legacy_sample_status
 
-        response = client_flat.get("/status?flat=1")
-        assert response.status_code == 200
-        data = response.json()
+        data = await _get_flat(client_flat)
 
         # Top-level fields from json_response.js
         expected_fields = {
@@ -397,7 +451,7 @@ class TestStatusFlatParity:
                     f"Zone field {field} should be {expected_type.__name__}, got {type(zone[field])}"
                 )
 
-    def test_zone_boolean_fields_as_integers(
+    async def test_zone_boolean_fields_as_integers(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """
@@ -408,9 +462,7 @@ class TestStatusFlatParity:
         """
         mock_client.get_status_data.return_value = legacy_sample_status
 
-        response = client_flat.get("/status?flat=1")
-        assert response.status_code == 200
-        data = response.json()
+        data = await _get_flat(client_flat)
 
         zone = data["zones"][0]
 
@@ -421,7 +473,7 @@ class TestStatusFlatParity:
                 # Document current behavior
                 print(f"Zone field {field}: {zone[field]} (type: {type(zone[field])})")
 
-    def test_mqtt_payload_mirrors_http_response(
+    async def test_mqtt_payload_mirrors_http_response(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """
@@ -434,9 +486,7 @@ class TestStatusFlatParity:
         mock_client.get_status_data.return_value = legacy_sample_status
 
         # Get HTTP flat response
-        response = client_flat.get("/status?flat=1")
-        assert response.status_code == 200
-        http_data = response.json()
+        http_data = await _get_flat(client_flat)
 
         # Convert same status to flat format (same path MQTT publisher uses)
         mqtt_data = legacy_sample_status.to_dict(flat=True)
@@ -451,7 +501,7 @@ class TestStatusFlatParity:
         if "zones" in mqtt_data and len(mqtt_data["zones"]) > 0:
             assert isinstance(mqtt_data["zones"][0]["damper_position"], str)
 
-    def test_flat_format_excludes_meta_wrapper(
+    async def test_flat_format_excludes_meta_wrapper(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """
@@ -462,9 +512,7 @@ class TestStatusFlatParity:
         """
         mock_client.get_status_data.return_value = legacy_sample_status
 
-        response = client_flat.get("/status?flat=1")
-        assert response.status_code == 200
-        data = response.json()
+        data = await _get_flat(client_flat)
 
         # Should NOT have wrapper keys
         assert "status" not in data, "flat=1 should not have 'status' wrapper (clarify)"
@@ -474,7 +522,7 @@ class TestStatusFlatParity:
         assert "system_mode" in data, "flat=1 should have system_mode at root level"
         assert "zones" in data, "flat=1 should have zones at root level"
 
-    def test_all_mode_type_consistency_across_endpoints(
+    async def test_all_mode_type_consistency_across_endpoints(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """
@@ -488,8 +536,7 @@ class TestStatusFlatParity:
         mock_client.get_status_data.return_value = legacy_sample_status
 
         # GET /status?flat=1
-        response = client_flat.get("/status?flat=1")
-        status_data = response.json()
+        status_data = await _get_flat(client_flat)
         assert isinstance(status_data.get("all_mode"), int), (
             "GET /status?flat=1 all_mode should be int"
         )
@@ -501,9 +548,9 @@ class TestStatusFlatParity:
 class TestStatusFlatEdgeCases:
     """Edge cases for flat format conversion."""
 
-    def test_flat_format_with_no_zones(self, client_flat, mock_client):
+    async def test_flat_format_with_no_zones(self, client_flat, mock_client):
         """Test flat format with empty zones array."""
-        status_no_zones = SystemStatus(
+        status_no_zones = SystemStatus.model_construct(
             system_time="Mon 03:00pm",
             system_mode=SystemMode.OFF,
             effective_mode=SystemMode.OFF,
@@ -519,15 +566,13 @@ class TestStatusFlatEdgeCases:
 
         mock_client.get_status_data.return_value = status_no_zones
 
-        response = client_flat.get("/status?flat=1")
-        assert response.status_code == 200
-        data = response.json()
+        data = await _get_flat(client_flat)
 
         assert data["zones"] == []
         assert data["all_mode"] == 0, "False should convert to 0"
         assert isinstance(data["time"], int), "time should still be present"
 
-    def test_flat_format_preserves_all_system_modes(
+    async def test_flat_format_preserves_all_system_modes(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """Test all SystemMode values convert to correct title-case strings."""
@@ -543,14 +588,13 @@ class TestStatusFlatEdgeCases:
             legacy_sample_status.system_mode = mode_enum
             mock_client.get_status_data.return_value = legacy_sample_status
 
-            response = client_flat.get("/status?flat=1")
-            data = response.json()
+            data = await _get_flat(client_flat)
 
             assert data["system_mode"] == expected_string, (
                 f"SystemMode.{mode_enum.name} should convert to '{expected_string}'"
             )
 
-    def test_flat_format_preserves_all_fan_modes(
+    async def test_flat_format_preserves_all_fan_modes(
         self, client_flat, mock_client, legacy_sample_status
     ):
         """Test all FanMode values convert to correct title-case strings."""
@@ -563,9 +607,17 @@ class TestStatusFlatEdgeCases:
             legacy_sample_status.fan_mode = mode_enum
             mock_client.get_status_data.return_value = legacy_sample_status
 
-            response = client_flat.get("/status?flat=1")
-            data = response.json()
+            data = await _get_flat(client_flat)
 
             assert data["fan_mode"] == expected_string, (
                 f"FanMode.{mode_enum.name} should convert to '{expected_string}'"
             )
+
+    def test_damper_position_outside_percent_range(self, legacy_sample_status):
+        """Out-of-range damper readings still stringify instead of failing."""
+        zone = _BASE_ZONES[0].model_copy(update={"damper_position": 120})
+        status = legacy_sample_status.model_copy(update={"zones": [zone]})
+
+        data = status.to_dict(flat=True)
+
+        assert data["zones"][0]["damper_position"] == "120"
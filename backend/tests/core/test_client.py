@@ -1,41 +1,190 @@
 # tests/core/test_client.py
-from unittest.mock import AsyncMock, MagicMock, patch
+import functools
+from collections.abc import Iterable, Iterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from pycz2.core.client import ComfortZoneIIClient
 from pycz2.core.constants import (
+    MAX_SEND_RETRIES,
+    READ_QUERIES,
     FanMode,
     Function,
-    MAX_REPLY_ATTEMPTS,
-    MAX_SEND_RETRIES,
     SystemMode,
 )
 from pycz2.core.frame import build_message
 from pycz2.core.models import SystemStatus
 
+# Reply data for each query in READ_QUERIES needed for status, keyed by
+# query ("dest.table.row")
+_STATUS_REPLY_DATA: dict[str, tuple[int, ...]] = {
+    # Outside temp data
+    "9.9.3": (0, 9, 3, 0, 0, 0, 0, 65, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+    # Damper positions
+    "9.9.4": (0, 9, 4, 15, 12, 8, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+    # Panel status (fan on)
+    "9.9.5": (0, 9, 5, 32, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+    # Zone 1 humidity
+    "1.1.9": (0, 1, 9, 0, 45, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+    # System mode
+    "1.1.12": (0, 1, 12, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+    # Setpoints
+    "1.1.16": (0, 1, 16, 74, 74, 74, 74, 0, 0, 0, 0, 68, 68, 68, 68, 0, 0, 0, 0),
+    # Fan mode
+    "1.1.17": (0, 1, 17, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+    # Time
+    "1.1.18": (0, 1, 18, 2, 14, 30, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+    # Zone temps
+    "1.1.24": (0, 1, 24, 72, 70, 68, 66, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+}
+
+# Frames are immutable bytes, so they are built (and CRC'd) once at import
+# and shared by every test. Each reply comes from the query's destination.
+_STATUS_MOCK_FRAMES: dict[str, bytes] = {
+    query: build_message(99, int(query.split(".", 1)[0]), Function.reply, list(data))
+    for query, data in _STATUS_REPLY_DATA.items()
+}
+
+@functools.lru_cache(maxsize=64)
+def _reply(data: tuple[int, ...], src: int = 1, dst: int = 99) -> bytes:
+    """Reply frame from ``src`` to the client, built once per distinct frame."""
+    return build_message(dst, src, Function.reply, list(data))
+
+
+# Write acknowledgements: _OK_REPLY addressed to the client, _ACK_REPLY as
+# sent back by the destination, _ERROR_REPLY_1 carrying reply code 1
+_OK_REPLY = build_message(99, 1, Function.reply, [0])
+_ACK_REPLY = build_message(1, 9, Function.reply, [0])
+_ERROR_REPLY_1 = build_message(99, 1, Function.reply, [1])
+
+# Reply addressed to device 1 rather than the client (99), and an error reply
+_WRONG_DEST_FRAME = build_message(1, 1, Function.reply, [0, 1, 16, 42])
+_ERROR_FRAME = build_message(99, 1, Function.error, [5])
+
+# Frames test_set_zone_setpoints must send: read rows 12 and 16, then write
+# row 16 (zones 1-2 cool 76 / heat 70) before row 12 (temporary bits set)
+_EXPECTED_SET_SETPOINTS_WRITES = [
+    build_message(1, 99, Function.read, [0, 1, 12]),
+    build_message(1, 99, Function.read, [0, 1, 16]),
+    build_message(
+        1, 99, Function.write,
+        [0, 1, 16, 76, 76, 0, 74, 74, 74, 74, 0, 70, 70, 68, 68, 0, 0, 0, 0],
+    ),
+    build_message(
+        1, 99, Function.write,
+        [0, 1, 12, 0, 2, 0, 2, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    ),
+]
+
+# Replies in the order get_status_data sends its queries
+_QUERY_ORDER = tuple(READ_QUERIES)
+_STATUS_FRAME_SEQUENCE = tuple(_STATUS_MOCK_FRAMES[q] for q in _QUERY_ORDER)
+# The same replies as one byte stream, as they would arrive on the bus
+_STATUS_STREAM = b"".join(_STATUS_FRAME_SEQUENCE)
+
+
+class _StubReader:
+    """
+    Minimal StreamReader: each read() returns the next fed reply, then
+    ``default`` once none are queued. Exceptions are raised instead of
+    returned. Running out of fed replies looks like an exhausted mock
+    side effect (StopAsyncIteration), which the client treats as an empty
+    read.
+    """
+
+    __slots__ = ("_replies", "default")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self._replies: Iterator[bytes | BaseException] | None = None
+        self.default: bytes | BaseException = b""
+
+    def feed(self, replies: Iterable[bytes | BaseException]) -> None:
+        self._replies = iter(replies)
+
+    async def read(self, n: int = -1) -> bytes:
+        if self._replies is None:
+            reply = self.default
+        else:
+            reply = next(self._replies, None)
+            if reply is None:
+                raise StopAsyncIteration
+        if isinstance(reply, BaseException):
+            raise reply
+        return reply
+
+
+class _StreamReader:
+    """
+    StreamReader over one pre-joined byte buffer: read(n) hands out the
+    next n bytes (frames may be split across reads), then b"" at EOF.
+    """
+
+    __slots__ = ("_buf", "_off")
+
+    def __init__(self, data: bytes) -> None:
+        self._buf = data
+        self._off = 0
+
+    async def read(self, n: int = -1) -> bytes:
+        start = self._off
+        self._off = len(self._buf) if n < 0 else min(start + n, len(self._buf))
+        return self._buf[start:self._off]
+
+
+class _StubWriter:
+    """Minimal StreamWriter that records written frames in ``writes``."""
 
-class TestComfortZoneIIClient:
-    """Test cases for ComfortZoneIIClient."""
+    __slots__ = ("close_calls", "wait_closed_calls", "writes")
 
-    @pytest.fixture
-    def mock_reader(self):
-        """Create a mock StreamReader."""
-        reader = MagicMock()
-        reader.read = AsyncMock(return_value=b"")
-        return reader
+    def __init__(self) -> None:
+        self.reset()
 
-    @pytest.fixture
-    def mock_writer(self):
-        """Create a mock StreamWriter."""
-        writer = MagicMock()
-        writer.is_closing = MagicMock(return_value=False)
-        writer.close = MagicMock(return_value=None)
-        writer.wait_closed = AsyncMock(return_value=None)
-        writer.write = MagicMock(return_value=None)
-        writer.drain = AsyncMock(return_value=None)
-        writer.get_extra_info = MagicMock(return_value=None)
-        return writer
+    def reset(self) -> None:
+        self.writes: list[bytes] = []
+        self.close_calls = 0
+        self.wait_closed_calls = 0
+
+    def write(self, data: bytes) -> None:
+        self.writes.append(data)
+
+    async def drain(self) -> None:
+        pass
+
+    def is_closing(self) -> bool:
+        return self.close_calls > 0
+
+    def close(self) -> None:
+        self.close_calls += 1
+
+    async def wait_closed(self) -> None:
+        self.wait_closed_calls += 1
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        return default
+
+
+@pytest.fixture(scope="module")
+def reader():
+    """Create a stub StreamReader, shared by the module and reset per test."""
+    return _StubReader()
+
+
+@pytest.fixture(scope="module")
+def writer():
+    """Create a stub StreamWriter, shared by the module and reset per test."""
+    return _StubWriter()
+
+
+# Keep the class on one xdist worker so the module-scoped stubs are built
+# once rather than once per worker
+@pytest.mark.xdist_group("client")
+class TestComfortZoneIIClient:
+    """Test cases for ComfortZoneIIClient."""
 
     @pytest.fixture
     def client(self):
@@ -55,48 +204,32 @@ class TestComfortZoneIIClient:
             device_id=99
         )
 
-    def create_mock_frame_data(self, dest: int, source: int, func: Function, data: list[int]) -> bytes:
-        """Helper to create valid frame data for mocking."""
-        return build_message(dest, source, func, data)
-
-    def create_status_mock_data(self) -> dict[str, bytes]:
-        """Create mock frame data for all READ_QUERIES needed for status."""
-        mock_frames = {}
-        
-        # Mock data for each query in READ_QUERIES
-        queries_data = {
-            "9.9.3": [0, 9, 3, 0, 0, 0, 0, 65, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # Outside temp data
-            "9.9.4": [0, 9, 4, 15, 12, 8, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # Damper positions
-            "9.9.5": [0, 9, 5, 32, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # Panel status (fan on)
-            "1.1.9": [0, 1, 9, 0, 45, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # Zone 1 humidity
-            "1.1.12": [0, 1, 12, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # System mode
-            "1.1.16": [0, 1, 16, 74, 74, 74, 74, 0, 0, 0, 0, 68, 68, 68, 68, 0, 0, 0, 0],  # Setpoints
-            "1.1.17": [0, 1, 17, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # Fan mode
-            "1.1.18": [0, 1, 18, 2, 14, 30, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # Time
-            "1.1.24": [0, 1, 24, 72, 70, 68, 66, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # Zone temps
-        }
-        
-        for query, data in queries_data.items():
-            dest, table, row = map(int, query.split("."))
-            mock_frames[query] = self.create_mock_frame_data(99, dest, Function.reply, data)
-        
-        return mock_frames
-
-    @pytest.mark.asyncio
-    async def test_tcp_connection(self, client, mock_reader, mock_writer):
+    @pytest.fixture
+    def connected_client(self, client, reader, writer):
+        """The TCP client wired to the stub reader/writer, with both stubs."""
+        client.reader = reader
+        client.writer = writer
+        return client, reader, writer
+
+    @pytest.fixture(autouse=True)
+    def _reset_stubs(self, reader, writer):
+        """Clear replies and recorded writes left by the previous test."""
+        reader.reset()
+        writer.reset()
+
+    async def test_tcp_connection(self, client, reader, writer):
         """Test TCP connection establishment."""
-        with patch('asyncio.open_connection', return_value=(mock_reader, mock_writer)) as mock_open:
-            await client.connect()
-            
-            mock_open.assert_called_once_with('localhost', 8080)
-            assert client.reader == mock_reader
-            assert client.writer == mock_writer
-            assert client.is_connected()
+        client._connector = AsyncMock(return_value=(reader, writer))
+        await client.connect()
+
+        client._connector.assert_called_once_with('localhost', 8080)
+        assert client.reader == reader
+        assert client.writer == writer
+        assert client.is_connected()
 
-    @pytest.mark.asyncio
-    async def test_serial_connection(self, serial_client, mock_reader, mock_writer):
+    async def test_serial_connection(self, serial_client, reader, writer):
         """Test serial connection establishment."""
-        with patch('pyserial_asyncio.open_serial_connection', return_value=(mock_reader, mock_writer)) as mock_open:
+        with patch('pyserial_asyncio.open_serial_connection', return_value=(reader, writer)) as mock_open:
             await serial_client.connect()
             
             mock_open.assert_called_once_with(
@@ -106,48 +239,36 @@ class TestComfortZoneIIClient:
                 parity='N',
                 stopbits=1
             )
-            assert serial_client.reader == mock_reader
-            assert serial_client.writer == mock_writer
+            assert serial_client.reader == reader
+            assert serial_client.writer == writer
 
-    @pytest.mark.asyncio
     async def test_connection_failure(self, client):
         """Test connection failure handling."""
-        with patch('asyncio.open_connection', side_effect=OSError("Connection failed")):
-            with pytest.raises(OSError, match="Connection failed"):
-                await client.connect()
+        client._connector = AsyncMock(side_effect=OSError("Connection failed"))
+        with pytest.raises(OSError, match="Connection failed"):
+            await client.connect()
 
-    @pytest.mark.asyncio
-    async def test_close_connection(self, client, mock_reader, mock_writer):
+    async def test_close_connection(self, client, reader, writer):
         """Test connection closure."""
-        client.reader = mock_reader
-        client.writer = mock_writer
+        client.reader = reader
+        client.writer = writer
         
         await client.close()
         
-        mock_writer.close.assert_called_once()
-        mock_writer.wait_closed.assert_called_once()
+        assert writer.close_calls == 1
+        assert writer.wait_closed_calls == 1
         assert client.reader is None
         assert client.writer is None
 
-    @pytest.mark.asyncio
-    async def test_get_status_data(self, client, mock_reader, mock_writer):
-        """Test successful status data retrieval and parsing."""
-        # Setup mock data
-        mock_frames = self.create_status_mock_data()
-        
-        # Configure mock reader to return frames in sequence
-        frame_sequence = []
-        for query in ["9.9.3", "9.9.4", "9.9.5", "1.1.9", "1.1.12", "1.1.16", "1.1.17", "1.1.18", "1.1.24"]:
-            frame_sequence.append(mock_frames[query])
-        
-        mock_reader.read.side_effect = frame_sequence
-        
-        # Setup client with mocked connection
-        client.reader = mock_reader
-        client.writer = mock_writer
-        
+    @pytest.mark.parametrize("include_raw", [False, True])
+    async def test_get_status_data(self, connected_client, include_raw):
+        """Test status data retrieval and parsing, with and without raw."""
+        client, _, _ = connected_client
+        # Serve every reply from a single buffer, as a real stream would
+        client.reader = _StreamReader(_STATUS_STREAM)
+
         # Call get_status_data
-        result = await client.get_status_data()
+        result = await client.get_status_data(include_raw=include_raw)
         
         # Verify the result is a SystemStatus object
         assert isinstance(result, SystemStatus)
@@ -165,7 +286,12 @@ class TestComfortZoneIIClient:
         assert result.humidify is False
         assert result.dehumidify is False
         assert result.reversing_valve is False
-        assert result.raw is None
+        if include_raw:
+            # Base64 blob of the raw rows
+            assert isinstance(result.raw, str)
+            assert len(result.raw) > 0
+        else:
+            assert result.raw is None
         assert len(result.zones) == 4
         
         # Verify zone data
@@ -176,53 +302,19 @@ class TestComfortZoneIIClient:
         assert zone.temperature == 72
         assert zone.damper_position == 100  # 15/15 * 100
 
-    @pytest.mark.asyncio
-    async def test_get_status_data_with_raw(self, client, mock_reader, mock_writer):
-        """Ensure include_raw=True returns base64 blob."""
-        mock_frames = self.create_status_mock_data()
-        frame_sequence = []
-        for query in [
-            "9.9.3",
-            "9.9.4",
-            "9.9.5",
-            "1.1.9",
-            "1.1.12",
-            "1.1.16",
-            "1.1.17",
-            "1.1.18",
-            "1.1.24",
-        ]:
-            frame_sequence.append(mock_frames[query])
-
-        mock_reader.read.side_effect = frame_sequence
-        client.reader = mock_reader
-        client.writer = mock_writer
-
-        result = await client.get_status_data(include_raw=True)
-
-        assert isinstance(result.raw, str)
-        assert len(result.raw) > 0
-
-    @pytest.mark.asyncio
-    async def test_set_zone_setpoints(self, client, mock_reader, mock_writer):
+    async def test_set_zone_setpoints(self, connected_client):
         """Test zone setpoint modification with read-modify-write pattern."""
+        client, reader, writer = connected_client
         # Mock the initial read frames for rows 1.12 and 1.16
-        row12_data = [0, 1, 12, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-        row16_data = [0, 1, 16, 0, 0, 0, 74, 74, 74, 74, 0, 68, 68, 68, 68, 0, 0, 0, 0]
-        
-        row12_frame = self.create_mock_frame_data(99, 1, Function.reply, row12_data)
-        row16_frame = self.create_mock_frame_data(99, 1, Function.reply, row16_data)
-        
-        # Mock OK replies for write operations
-        ok_reply = self.create_mock_frame_data(1, 9, Function.reply, [0])
+        row12_data = (0, 1, 12, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        row16_data = (0, 1, 16, 0, 0, 0, 74, 74, 74, 74, 0, 68, 68, 68, 68, 0, 0, 0, 0)
         
-        # Setup mock reader to return frames in sequence
-        mock_reader.read.side_effect = [row12_frame, row16_frame, ok_reply, ok_reply]
-        
-        # Setup client with mocked connection
-        client.reader = mock_reader
-        client.writer = mock_writer
+        row12_frame = _reply(row12_data)
+        row16_frame = _reply(row16_data)
         
+        # Setup reader to return frames in sequence
+        reader.feed([row12_frame, row16_frame, _ACK_REPLY, _ACK_REPLY])
+
         # Call set_zone_setpoints
         await client.set_zone_setpoints(
             zones=[1, 2],
@@ -232,180 +324,120 @@ class TestComfortZoneIIClient:
         )
         
         # Verify write calls were made
-        assert mock_writer.write.call_count == 4  # 2 reads + 2 writes
-        
-        # Verify the write data contains modified setpoints
-        write_calls = [call[0][0] for call in mock_writer.write.call_args_list]
-        
-        # Check that writes were made (exact frame validation would require frame parsing)
-        assert len(write_calls) == 4
-        assert all(len(call) > 10 for call in write_calls)  # All should be valid frames
+        # 2 reads + 2 writes, byte for byte
+        assert writer.writes == _EXPECTED_SET_SETPOINTS_WRITES
 
-    @pytest.mark.asyncio
-    async def test_set_system_mode(self, client, mock_reader, mock_writer):
+    async def test_set_system_mode(self, connected_client):
         """Test system mode setting."""
+        client, reader, writer = connected_client
         # Mock the initial read frame for row 1.12
-        row12_data = [0, 1, 12, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-        row12_frame = self.create_mock_frame_data(99, 1, Function.reply, row12_data)
-        
-        # Mock OK reply
-        ok_reply = self.create_mock_frame_data(1, 9, Function.reply, [0])
-        
-        mock_reader.read.side_effect = [row12_frame, ok_reply]
-        
-        client.reader = mock_reader
-        client.writer = mock_writer
+        row12_data = (0, 1, 12, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        row12_frame = _reply(row12_data)
         
+        reader.feed([row12_frame, _ACK_REPLY])
+
         await client.set_system_mode(SystemMode.HEAT, True)
         
         # Verify read and write calls
-        assert mock_writer.write.call_count == 2  # 1 read + 1 write
+        assert len(writer.writes) == 2  # 1 read + 1 write
         
-    @pytest.mark.asyncio
-    async def test_set_fan_mode(self, client, mock_reader, mock_writer):
+    async def test_set_fan_mode(self, connected_client):
         """Test fan mode setting."""
+        client, reader, writer = connected_client
         # Mock the initial read frame for row 1.17
-        row17_data = [0, 1, 17, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-        row17_frame = self.create_mock_frame_data(99, 1, Function.reply, row17_data)
-        
-        # Mock OK reply
-        ok_reply = self.create_mock_frame_data(1, 9, Function.reply, [0])
-        
-        mock_reader.read.side_effect = [row17_frame, ok_reply]
-        
-        client.reader = mock_reader
-        client.writer = mock_writer
+        row17_data = (0, 1, 17, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        row17_frame = _reply(row17_data)
         
+        reader.feed([row17_frame, _ACK_REPLY])
+
         await client.set_fan_mode(FanMode.ON)
         
         # Verify read and write calls
-        assert mock_writer.write.call_count == 2  # 1 read + 1 write
+        assert len(writer.writes) == 2  # 1 read + 1 write
+
+    @pytest.mark.parametrize(
+        "reply, exc, match, expected_writes",
+        [
+            # Replies for the wrong destination: time out after every retry
+            (_WRONG_DEST_FRAME, TimeoutError, "No valid reply received", MAX_SEND_RETRIES),
+            # Error reply: raised as OSError with the error data
+            (_ERROR_FRAME, OSError, "Error reply received", 1),
+            # Read failure: raised directly (no Tenacity retry wrapper)
+            (ConnectionAbortedError("Connection lost"), ConnectionAbortedError, None, 1),
+        ],
+        ids=["wrong_destination", "error_response", "connection_error"],
+    )
+    async def test_send_with_reply_errors(
+        self, connected_client, reply, exc, match, expected_writes
+    ):
+        """Test send_with_reply failure modes."""
+        client, reader, writer = connected_client
+        reader.default = reply
 
-    @pytest.mark.asyncio
-    async def test_send_with_reply_wrong_destination(self, client, mock_reader, mock_writer):
-        """Test send_with_reply with wrong destination in reply."""
-        # Mock frame with wrong destination (should be 99, but we'll use 1)
-        wrong_dest_frame = self.create_mock_frame_data(1, 1, Function.reply, [0, 1, 16, 42])
-        
-        # Setup mock to always return a reply for the wrong destination
-        mock_reader.read.side_effect = [wrong_dest_frame] * (
-            MAX_SEND_RETRIES * MAX_REPLY_ATTEMPTS + 5
-        )
-        
-        client.reader = mock_reader
-        client.writer = mock_writer
-        
-        # Should raise TimeoutError after retries
-        with pytest.raises(TimeoutError, match="No valid reply received"):
+        with pytest.raises(exc, match=match):
             await client.send_with_reply(1, Function.read, [0, 1, 16])
 
-        # Ensure the client retried the full number of transmissions
-        assert mock_writer.write.call_count == MAX_SEND_RETRIES
+        assert len(writer.writes) == expected_writes
 
-    @pytest.mark.asyncio
-    async def test_send_with_reply_allows_destination_ack(self, client, mock_reader, mock_writer):
+    async def test_send_with_reply_allows_destination_ack(self, connected_client):
         """Ensure acknowledgements addressed to the destination are accepted."""
-        ack_frame = self.create_mock_frame_data(1, 9, Function.reply, [0])
-
-        mock_reader.read.side_effect = [ack_frame]
-        client.reader = mock_reader
-        client.writer = mock_writer
+        client, reader, _ = connected_client
+        reader.feed([_ACK_REPLY])
 
         reply = await client.send_with_reply(1, Function.write, [0, 1, 16, 0])
 
         assert reply.data[0] == 0
 
-    @pytest.mark.asyncio
-    async def test_send_with_reply_error_response(self, client, mock_reader, mock_writer):
-        """Test send_with_reply with error response."""
-        # Mock error frame
-        error_frame = self.create_mock_frame_data(99, 1, Function.error, [5])  # Some error code
-        
-        mock_reader.read.return_value = error_frame
-        
-        client.reader = mock_reader
-        client.writer = mock_writer
-        
-        # Should raise OSError with error message
-        with pytest.raises(OSError, match="Error reply received"):
-            await client.send_with_reply(1, Function.read, [0, 1, 16])
-
-    @pytest.mark.asyncio
-    async def test_send_with_reply_connection_error(self, client, mock_reader, mock_writer):
-        """Test send_with_reply with connection error during read."""
-        # Mock connection error
-        mock_reader.read.side_effect = ConnectionAbortedError("Connection lost")
-
-        client.reader = mock_reader
-        client.writer = mock_writer
-
-        # Should raise ConnectionAbortedError directly (no Tenacity retry wrapper)
-        with pytest.raises(ConnectionAbortedError):
-            await client.send_with_reply(1, Function.read, [0, 1, 16])
-
-    @pytest.mark.asyncio
-    async def test_read_row(self, client, mock_reader, mock_writer):
+    async def test_read_row(self, connected_client):
         """Test read_row method."""
+        client, reader, writer = connected_client
         # Mock valid reply frame
-        reply_data = [0, 1, 16, 74, 74, 74, 74]
-        reply_frame = self.create_mock_frame_data(99, 1, Function.reply, reply_data)
-        
-        mock_reader.read.return_value = reply_frame
-        
-        client.reader = mock_reader
-        client.writer = mock_writer
+        reply_data = (0, 1, 16, 74, 74, 74, 74)
+        reply_frame = _reply(reply_data)
         
+        reader.default = reply_frame
+
         result = await client.read_row(1, 1, 16)
         
         # Verify the call was made and result is returned
-        mock_writer.write.assert_called_once()
+        assert len(writer.writes) == 1
         assert result.destination == 99
         assert result.source == 1
         assert result.function == Function.reply
 
-    @pytest.mark.asyncio
-    async def test_write_row_success(self, client, mock_reader, mock_writer):
+    async def test_write_row_success(self, connected_client):
         """Test successful write_row operation."""
-        # Mock OK reply
-        ok_reply = self.create_mock_frame_data(99, 1, Function.reply, [0])
-        
-        mock_reader.read.return_value = ok_reply
-        
-        client.reader = mock_reader
-        client.writer = mock_writer
-        
+        client, reader, writer = connected_client
+        reader.default = _OK_REPLY
+
         # Should not raise any exception
         await client.write_row(1, 1, 16, [74, 74, 74, 74])
         
-        mock_writer.write.assert_called_once()
+        assert len(writer.writes) == 1
 
-    @pytest.mark.asyncio
-    async def test_write_row_failure(self, client, mock_reader, mock_writer):
+    async def test_write_row_failure(self, connected_client):
         """Test write_row with error response."""
-        # Mock error reply (non-zero first byte)
-        error_reply = self.create_mock_frame_data(99, 1, Function.reply, [1])  # Error code 1
-        
-        mock_reader.read.return_value = error_reply
-        
-        client.reader = mock_reader
-        client.writer = mock_writer
-        
+        client, reader, _ = connected_client
+        # Error reply (non-zero first byte)
+        reader.default = _ERROR_REPLY_1
+
         # Should raise OSError
         with pytest.raises(OSError, match="Write failed with reply code 1"):
             await client.write_row(1, 1, 16, [74, 74, 74, 74])
 
-    @pytest.mark.asyncio
-    async def test_context_manager(self, client, mock_reader, mock_writer):
+    async def test_context_manager(self, client, reader, writer):
         """Test client as async context manager."""
-        with patch('asyncio.open_connection', return_value=(mock_reader, mock_writer)):
-            async with client:
-                assert client.is_connected()
-            
-            # Should be closed after context exit
-            mock_writer.close.assert_called_once()
-            mock_writer.wait_closed.assert_called_once()
+        async def connector(host: str, port: int):
+            return reader, writer
+
+        client._connector = connector
+        async with client:
+            assert client.is_connected()
+
+        # Should be closed after context exit
+        assert writer.close_calls == 1
+        assert writer.wait_closed_calls == 1
 
-    @pytest.mark.asyncio
     async def test_connection_not_established_error(self, client):
         """Test operations without established connection."""
         # Try to read without connection
@@ -416,21 +448,18 @@ class TestComfortZoneIIClient:
         with pytest.raises(ConnectionError, match="Not connected"):
             await client._write_data(b"test")
 
-    @pytest.mark.asyncio
-    async def test_get_frame_parsing(self, client, mock_reader, mock_writer):
+    async def test_get_frame_parsing(self, connected_client):
         """Test frame parsing from buffer."""
+        client, reader, _ = connected_client
         # Create a valid frame
-        valid_frame = self.create_mock_frame_data(99, 1, Function.reply, [0, 1, 16, 74])
+        valid_frame = _reply((0, 1, 16, 74))
         
         # Add some invalid data before the valid frame
         invalid_data = b'\x00\x00\x00'
         full_data = invalid_data + valid_frame
         
-        mock_reader.read.return_value = full_data
-        
-        client.reader = mock_reader
-        client.writer = mock_writer
-        
+        reader.default = full_data
+
         result = await client.get_frame()
         
         # Verify we got a valid frame
@@ -438,58 +467,49 @@ class TestComfortZoneIIClient:
         assert result.source == 1
         assert result.function == Function.reply
 
-    def test_is_serial_detection(self):
+    @pytest.mark.parametrize(
+        "connect_str, expected_serial",
+        [("localhost:8080", False), ("/dev/ttyUSB0", True)],
+    )
+    def test_is_serial_detection(self, connect_str, expected_serial):
         """Test serial vs TCP connection detection."""
-        tcp_client = ComfortZoneIIClient("localhost:8080", 4, 99)
-        serial_client = ComfortZoneIIClient("/dev/ttyUSB0", 4, 99)
-
-        assert not tcp_client._is_serial
-        assert serial_client._is_serial
+        assert ComfortZoneIIClient(connect_str, 4, 99)._is_serial is expected_serial
 
-    @pytest.mark.asyncio
-    async def test_set_zone_hold_only_writes_row12(self, client, mock_reader, mock_writer):
+    async def test_set_zone_hold_only_writes_row12(self, connected_client):
         """Finding #8: set_zone_setpoints with hold=True only should write row 12, not row 16."""
-        row12_data = [0, 1, 12, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-        row12_frame = self.create_mock_frame_data(99, 1, Function.reply, row12_data)
+        client, reader, writer = connected_client
+        row12_data = (0, 1, 12, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        row12_frame = _reply(row12_data)
 
         # Only need one OK reply (for row 12 write only)
-        ok_reply = self.create_mock_frame_data(1, 9, Function.reply, [0])
-
-        mock_reader.read.side_effect = [row12_frame, ok_reply]
-        client.reader = mock_reader
-        client.writer = mock_writer
+        reader.feed([row12_frame, _ACK_REPLY])
 
         await client.set_zone_setpoints(zones=[1], hold=True)
 
         # Should be 1 read (row 12) + 1 write (row 12) = 2 calls
-        assert mock_writer.write.call_count == 2
+        assert len(writer.writes) == 2
 
-    @pytest.mark.asyncio
-    async def test_set_zone_setpoints_writes_row16_before_row12(
-        self, client, mock_reader, mock_writer
-    ):
+    async def test_set_zone_setpoints_writes_row16_before_row12(self, connected_client):
         """Finding #8: When both rows need writing, row 16 (setpoints) before row 12 (flags)."""
-        row12_data = [0, 1, 12, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-        row16_data = [0, 1, 16, 0, 0, 0, 74, 74, 74, 74, 0, 68, 68, 68, 68, 0, 0, 0, 0]
+        client, reader, writer = connected_client
+        row12_data = (0, 1, 12, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        row16_data = (0, 1, 16, 0, 0, 0, 74, 74, 74, 74, 0, 68, 68, 68, 68, 0, 0, 0, 0)
 
-        row12_frame = self.create_mock_frame_data(99, 1, Function.reply, row12_data)
-        row16_frame = self.create_mock_frame_data(99, 1, Function.reply, row16_data)
-        ok_reply = self.create_mock_frame_data(1, 9, Function.reply, [0])
+        row12_frame = _reply(row12_data)
+        row16_frame = _reply(row16_data)
 
-        mock_reader.read.side_effect = [row12_frame, row16_frame, ok_reply, ok_reply]
-        client.reader = mock_reader
-        client.writer = mock_writer
+        reader.feed([row12_frame, row16_frame, _ACK_REPLY, _ACK_REPLY])
 
         await client.set_zone_setpoints(
             zones=[1], heat_setpoint=70, hold=True
         )
 
         # Should be 2 reads + 2 writes = 4 calls
-        assert mock_writer.write.call_count == 4
+        assert len(writer.writes) == 4
 
         # Parse the write calls to verify order: row 16 written before row 12
         from pycz2.core.frame import FRAME_PARSER
-        write_calls = [call[0][0] for call in mock_writer.write.call_args_list]
+        write_calls = writer.writes
         # write_calls[0] and [1] are reads; [2] and [3] are writes
         write_frame_1 = FRAME_PARSER.parse(write_calls[2])
         write_frame_2 = FRAME_PARSER.parse(write_calls[3])
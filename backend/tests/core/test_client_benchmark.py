@@ -0,0 +1,51 @@
+# tests/core/test_client_benchmark.py
+"""
+Benchmarks for the frame build/parse and status decode hot paths.
+
+Timing is disabled under xdist, where each benchmark runs once as a plain
+test. To measure and compare runs:
+
+    pytest tests/core/test_client_benchmark.py -n0 --benchmark-autosave \
+        --benchmark-compare --benchmark-compare-fail=mean:5%
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from pycz2.core.client import ComfortZoneIIClient
+from pycz2.core.constants import Function
+from pycz2.core.frame import FRAME_PARSER, build_message
+
+from .test_client import _STATUS_MOCK_FRAMES, _STATUS_REPLY_DATA
+
+# Setpoints row reply: the longest frame get_status_data reads
+_SETPOINTS_DATA = list(_STATUS_REPLY_DATA["1.1.16"])
+_SETPOINTS_FRAME = _STATUS_MOCK_FRAMES["1.1.16"]
+
+# What get_status_data has collected by the time it decodes: the data
+# bytes of each reply keyed by "table.row"
+_STATUS_DATA_CACHE = {
+    query.split(".", 1)[1]: list(FRAME_PARSER.parse(frame).data)
+    for query, frame in _STATUS_MOCK_FRAMES.items()
+}
+
+
+@pytest.mark.benchmark(group="frame")
+def test_build_message(benchmark):
+    frame = benchmark(build_message, 99, 1, Function.reply, _SETPOINTS_DATA)
+    assert frame == _SETPOINTS_FRAME
+
+
+@pytest.mark.benchmark(group="frame")
+def test_parse_frame(benchmark):
+    frame = benchmark(FRAME_PARSER.parse, _SETPOINTS_FRAME)
+    assert list(frame.data) == _SETPOINTS_DATA
+
+
+# get_status_data itself spends nearly all of its wall time in the 20 ms
+# bus-settle sleep after each query, so the decode step is measured alone
+@pytest.mark.benchmark(group="status")
+def test_parse_status(benchmark):
+    client = ComfortZoneIIClient("localhost:8080", 4, 99)
+    status = benchmark(client._parse_status_from_cache, _STATUS_DATA_CACHE)
+    assert status.zones[0].temperature == 72
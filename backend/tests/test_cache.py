@@ -57,6 +57,20 @@ class TestCacheSubscriberNotification:
         assert update["status"]["system_time"] == "Mon 02:30pm"
         assert "meta" in update
 
+    @pytest.mark.asyncio
+    async def test_subscriber_update_omits_raw(self, cache):
+        """Raw data is persisted but never pushed to subscribers."""
+        await cache.initialize()
+        queue = await cache.subscribe()
+        queue.get_nowait()
+
+        status = _make_status().model_copy(update={"raw": "AAEC"})
+        await cache.update(status, source="test")
+
+        update = queue.get_nowait()
+        assert "raw" not in update["status"]
+        assert update["status"]["zones"][0]["damper_position"] == 75
+
     @pytest.mark.asyncio
     async def test_update_without_subscribers_succeeds(self, cache):
         """Cache.update() with no subscribers should work fine."""
@@ -67,3 +81,33 @@ class TestCacheSubscriberNotification:
         result, meta = await cache.get()
         assert result.system_time == "Mon 02:30pm"
         assert meta.source == "test"
+
+
+class TestCachePartialUpdate:
+    """update_partial merges onto the cached status without a full copy."""
+
+    @pytest.mark.asyncio
+    async def test_partial_update_keeps_untouched_fields(self, cache):
+        await cache.initialize()
+        await cache.update(_make_status(), source="test")
+        _, before = await cache.get()
+        version = before.version
+
+        await cache.update_partial({"fan_mode": "On"}, source="optimistic")
+
+        result, meta = await cache.get()
+        assert result.fan_mode == FanMode.ON
+        assert result.zones[0].cool_setpoint == 74
+        assert meta.source == "optimistic"
+        assert meta.version == version + 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_partial_update_is_ignored(self, cache):
+        await cache.initialize()
+        await cache.update(_make_status(), source="test")
+
+        await cache.update_partial({"fan_mode": "Sideways"}, source="optimistic")
+
+        result, meta = await cache.get()
+        assert result.fan_mode == FanMode.AUTO
+        assert meta.source == "test"
@@ -1,527 +1,564 @@
 # tests/test_cli.py
-from unittest.mock import AsyncMock
+import functools
+from collections.abc import AsyncIterator, Iterable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from types import SimpleNamespace
+from typing import Any
 
+import orjson
 import pytest
+import typer
+from typer.exceptions import TyperException
 from typer.testing import CliRunner
 
 from pycz2 import cli
-from pycz2.core.client import ComfortZoneIIClient
 from pycz2.core.constants import FanMode, SystemMode
 from pycz2.core.models import SystemStatus, ZoneStatus
 
+# Keep this module's tests on one xdist worker: they share the module-scoped
+# fake client and the patched cli.get_client
+pytestmark = pytest.mark.xdist_group("cli")
 
-class TestCLIIntegration:
-    """Integration tests for the CLI application."""
-
-    @pytest.fixture
-    def runner(self):
-        """Create a CliRunner instance."""
-        return CliRunner()
-
-    @pytest.fixture
-    def mock_client(self):
-        """Create a mock ComfortZoneIIClient."""
-        client = AsyncMock(spec=ComfortZoneIIClient)
-        
-        # Mock the context manager behavior
-        client.connection.return_value.__aenter__ = AsyncMock(return_value=None)
-        client.connection.return_value.__aexit__ = AsyncMock(return_value=None)
-        
-        return client
-
-    @pytest.fixture
-    def sample_status(self):
-        """Create a sample SystemStatus object for testing."""
-        zones = [
-            ZoneStatus(
-                zone_id=1,
-                temperature=72,
-                damper_position=75,
-                cool_setpoint=74,
-                heat_setpoint=68,
-                temporary=False,
-                hold=False,
-                out=False
-            ),
-            ZoneStatus(
-                zone_id=2,
-                temperature=70,
-                damper_position=50,
-                cool_setpoint=76,
-                heat_setpoint=66,
-                temporary=True,
-                hold=False,
-                out=False
-            ),
-            ZoneStatus(
-                zone_id=3,
-                temperature=68,
-                damper_position=25,
-                cool_setpoint=72,
-                heat_setpoint=64,
-                temporary=False,
-                hold=True,
-                out=False
-            ),
-            ZoneStatus(
-                zone_id=4,
-                temperature=0,
-                damper_position=0,
-                cool_setpoint=72,
-                heat_setpoint=64,
-                temporary=False,
-                hold=False,
-                out=True
-            )
-        ]
-        
-        return SystemStatus(
-            system_time="Mon 02:30pm",
-            system_mode=SystemMode.AUTO,
-            effective_mode=SystemMode.COOL,
-            fan_mode=FanMode.AUTO,
-            fan_state="On",
-            active_state="Cool On",
-            all_mode=False,
-            outside_temp=85,
-            air_handler_temp=65,
-            zone1_humidity=45,
-            compressor_stage_1=False,
-            compressor_stage_2=False,
-            aux_heat_stage_1=False,
-            aux_heat_stage_2=False,
-            humidify=False,
-            dehumidify=False,
-            reversing_valve=False,
-            raw=None,
-            zones=zones
-        )
 
-    def test_status_command_success(self, runner, mock_client, sample_status, monkeypatch):
-        """Test successful status command execution."""
-        # Configure mock
-        mock_client.get_status_data.return_value = sample_status
-        
-        # Patch the get_client function
-        async def mock_get_client():
-            return mock_client
-        
-        monkeypatch.setattr(cli, "get_client", mock_get_client)
-        
-        # Run command
-        result = runner.invoke(cli.app, ["status"])
-        
-        # Verify exit code
-        assert result.exit_code == 0
-        
-        # Verify key content in output
-        assert "System Time:" in result.stdout
-        assert "Mon 02:30pm" in result.stdout
-        assert "Outside 85°F" in result.stdout
-        assert "Indoor humidity 45%" in result.stdout
-        assert "65°F, Fan On, Cool On" in result.stdout
-        assert "Auto (Cool), Fan Auto" in result.stdout
-        
-        # Verify zone table content
-        assert "Zone" in result.stdout  # Table header
-        assert "Temp (°F)" in result.stdout  # Table header
-        assert "Damper (%)" in result.stdout  # Table header
-        assert "Setpoint" in result.stdout  # Table header
-        assert "Mode" in result.stdout  # Table header
-        
-        # Verify zone data appears in output
-        assert "Zone 1" in result.stdout
-        assert "Zone 2" in result.stdout
-        assert "Zone 3" in result.stdout
-        assert "Zone 4" in result.stdout
-        assert "72" in result.stdout  # Zone 1 temperature
-        assert "70" in result.stdout  # Zone 2 temperature
-        assert "[TEMP]" in result.stdout  # Zone 2 temporary mode
-        assert "[HOLD]" in result.stdout  # Zone 3 hold mode
-        assert "OUT" in result.stdout  # Zone 4 out mode
-        
-        # Verify mock was called
-        mock_client.get_status_data.assert_called_once()
-
-    def test_status_command_failure(self, runner, mock_client, monkeypatch):
-        """Test status command with client failure."""
-        # Configure mock to raise TimeoutError (no more Tenacity wrapper)
-        mock_client.get_status_data.side_effect = TimeoutError("No valid reply received.")
-        
-        # Patch the get_client function
-        async def mock_get_client():
-            return mock_client
-        
-        monkeypatch.setattr(cli, "get_client", mock_get_client)
-        
-        # Run command
-        result = runner.invoke(cli.app, ["status"])
-        
-        # Verify exit code indicates failure
-        assert result.exit_code != 0
-        
-        # Verify mock was called
-        mock_client.get_status_data.assert_called_once()
-
-    def test_status_json_command_success(self, runner, mock_client, sample_status, monkeypatch):
-        """Test successful status-json command execution."""
-        # Configure mock
-        mock_client.get_status_data.return_value = sample_status
-        
-        # Patch the get_client function
-        async def mock_get_client():
-            return mock_client
-        
-        monkeypatch.setattr(cli, "get_client", mock_get_client)
-        
-        # Run command
-        result = runner.invoke(cli.app, ["status-json"])
-        
-        # Verify exit code
-        assert result.exit_code == 0
-        
-        # Verify JSON content in output
-        assert '"system_time": "Mon 02:30pm"' in result.stdout
-        assert '"system_mode": "Auto"' in result.stdout
-        assert '"outside_temp": 85' in result.stdout
-        assert '"zones":' in result.stdout
-        assert '"raw"' not in result.stdout
-
-        # Verify mock was called
-        mock_client.get_status_data.assert_called_once_with(include_raw=False)
-
-    def test_status_json_command_with_raw(self, runner, mock_client, sample_status, monkeypatch):
-        """status-json should include raw blob when requested."""
-        raw_blob = "QUJD"
-        mock_client.get_status_data.return_value = sample_status.model_copy(update={"raw": raw_blob})
-
-        async def mock_get_client():
-            return mock_client
-
-        monkeypatch.setattr(cli, "get_client", mock_get_client)
-
-        result = runner.invoke(cli.app, ["status-json", "--raw"])
-
-        assert result.exit_code == 0
-        assert f'"raw": "{raw_blob}"' in result.stdout
-        mock_client.get_status_data.assert_called_once_with(include_raw=True)
-
-    def test_set_system_command_success(self, runner, mock_client, sample_status, monkeypatch):
-        """Test successful set-system command execution."""
-        # Configure mocks
-        mock_client.set_system_mode.return_value = None
-        mock_client.set_fan_mode.return_value = None
-        mock_client.get_status_data.return_value = sample_status
-        
-        # Patch the get_client function
-        async def mock_get_client():
-            return mock_client
-        
-        monkeypatch.setattr(cli, "get_client", mock_get_client)
-        
-        # Run command
-        result = runner.invoke(cli.app, ["set-system", "--mode", "Heat", "--fan", "On", "--all"])
-        
-        # Verify exit code
-        assert result.exit_code == 0
-        
-        # Verify success message and status display
-        assert "System settings updated" in result.stdout
-        assert "New status:" in result.stdout
-        assert "System Time:" in result.stdout
-        
-        # Verify mock calls
-        mock_client.set_system_mode.assert_called_once_with(SystemMode.HEAT, True)
-        mock_client.set_fan_mode.assert_called_once_with(FanMode.ON)
-        mock_client.get_status_data.assert_called_once()
-
-    def test_set_system_command_no_options(self, runner, monkeypatch):
-        """Test set-system command with no options specified."""
-        # Patch the get_client function (though it shouldn't be called)
-        async def mock_get_client():
-            return AsyncMock()
-        
-        monkeypatch.setattr(cli, "get_client", mock_get_client)
-        
-        # Run command with no options
-        result = runner.invoke(cli.app, ["set-system"])
-        
-        # Verify exit code indicates failure
-        assert result.exit_code == 1
-        
-        # Verify error message
-        assert "No options specified" in result.stdout
-
-    def test_set_system_command_invalid_mode(self, runner):
-        """Test set-system command with invalid mode."""
-        # Run command with invalid mode
-        result = runner.invoke(cli.app, ["set-system", "--mode", "invalid-mode"])
-        
-        # Verify exit code indicates validation error
-        assert result.exit_code == 2
-        
-        # Verify error message contains information about invalid choice
-        assert "Invalid value" in result.stderr or "invalid-mode" in result.stderr
-
-    def test_set_zone_command_success(self, runner, mock_client, sample_status, monkeypatch):
-        """Test successful set-zone command execution."""
-        # Configure mocks
-        mock_client.set_zone_setpoints.return_value = None
-        mock_client.get_status_data.return_value = sample_status
-        
-        # Patch the get_client function
-        async def mock_get_client():
-            return mock_client
-        
-        monkeypatch.setattr(cli, "get_client", mock_get_client)
-        
-        # Run command
-        result = runner.invoke(cli.app, ["set-zone", "1", "3", "--heat", "70", "--cool", "76", "--temp"])
-        
-        # Verify exit code
-        assert result.exit_code == 0
-        
-        # Verify success message and status display
-        assert "Zone settings updated" in result.stdout
-        assert "New status:" in result.stdout
-        assert "System Time:" in result.stdout
-        
-        # Verify mock was called with correct arguments
-        mock_client.set_zone_setpoints.assert_called_once_with(
-            zones=[1, 3],
-            heat_setpoint=70,
-            cool_setpoint=76,
-            temporary_hold=True,
-            hold=None,
-            out_mode=None
-        )
-        mock_client.get_status_data.assert_called_once()
-
-    def test_set_zone_command_single_zone(self, runner, mock_client, sample_status, monkeypatch):
-        """Test set-zone command with single zone and hold option."""
-        # Configure mocks
-        mock_client.set_zone_setpoints.return_value = None
-        mock_client.get_status_data.return_value = sample_status
-        
-        # Patch the get_client function
-        async def mock_get_client():
-            return mock_client
-        
-        monkeypatch.setattr(cli, "get_client", mock_get_client)
-        
-        # Run command
-        result = runner.invoke(cli.app, ["set-zone", "2", "--heat", "68", "--hold", "--out"])
-        
-        # Verify exit code
-        assert result.exit_code == 0
-        
-        # Verify mock was called with correct arguments
-        mock_client.set_zone_setpoints.assert_called_once_with(
-            zones=[2],
-            heat_setpoint=68,
-            cool_setpoint=None,
-            temporary_hold=None,
-            hold=True,
-            out_mode=True
-        )
+# The Click command tree behind cli.app never changes; _invoke_fast
+# builds it once instead of on every call
+_get_command = functools.cache(typer.main.get_command)
 
-    def test_read_command_success(self, runner, mock_client, monkeypatch):
-        """Test successful read command execution."""
-        # Create a mock frame object
-        mock_frame = AsyncMock()
-        mock_frame.data = [0, 1, 16, 74, 74, 68, 68]
-        
-        # Configure mock
-        mock_client.read_row.return_value = mock_frame
-        
-        # Patch the get_client function
-        async def mock_get_client():
-            return mock_client
-        
-        monkeypatch.setattr(cli, "get_client", mock_get_client)
-        
-        # Run command
-        result = runner.invoke(cli.app, ["read", "1", "1", "16"])
-        
-        # Verify exit code
-        assert result.exit_code == 0
-        
-        # Verify output contains the frame data
-        assert "0.1.16.74.74.68.68" in result.stdout
-        
-        # Verify mock was called with correct arguments
-        mock_client.read_row.assert_called_once_with(1, 1, 16)
-
-    def test_monitor_command_setup(self, runner, mock_client, monkeypatch):
-        """Test monitor command setup (without actually monitoring)."""
-        # Create an async generator that yields one frame then stops
-        async def mock_monitor_bus():
-            mock_frame = AsyncMock()
-            mock_frame.source = 1
-            mock_frame.destination = 9
-            mock_frame.function.name = "read"
-            mock_frame.data = [0, 1, 16]
-            yield mock_frame
-            # End the generator to avoid infinite loop in test
-        
-        # Configure mock
-        mock_client.monitor_bus.return_value = mock_monitor_bus()
-        
-        # Patch the get_client function
-        async def mock_get_client():
-            return mock_client
-        
-        monkeypatch.setattr(cli, "get_client", mock_get_client)
-        
-        # Run command (this will run until the generator is exhausted)
-        result = runner.invoke(cli.app, ["monitor"])
-        
-        # Verify exit code
-        assert result.exit_code == 0
-        
-        # Verify monitoring setup message
-        assert "Monitoring bus traffic" in result.stdout
-        
-        # Verify frame output format
-        assert "01 -> 09" in result.stdout
-        assert "read" in result.stdout
-        assert "0.1.16" in result.stdout
-
-    def test_invalid_command(self, runner):
-        """Test execution of non-existent command."""
-        result = runner.invoke(cli.app, ["nonexistent"])
-        
-        # Verify exit code indicates command not found
-        assert result.exit_code == 2
-        
-        # Verify error message
-        assert "No such command" in result.stderr or "Usage:" in result.stdout
-
-    def test_help_output(self, runner):
-        """Test help output for main app."""
-        result = runner.invoke(cli.app, ["--help"])
-        
-        # Verify exit code
-        assert result.exit_code == 0
-        
-        # Verify help content
-        assert "Command-Line Interface for interacting with the HVAC system" in result.stdout
-        assert "status" in result.stdout
-        assert "set-system" in result.stdout
-        assert "set-zone" in result.stdout
-        assert "monitor" in result.stdout
-        assert "read" in result.stdout
-
-    def test_status_command_help(self, runner):
-        """Test help output for status command."""
-        result = runner.invoke(cli.app, ["status", "--help"])
-        
-        # Verify exit code
-        assert result.exit_code == 0
-        
-        # Verify help content
-        assert "Print an overview of the current system status" in result.stdout
-
-    def test_set_zone_command_help(self, runner):
-        """Test help output for set-zone command."""
-        result = runner.invoke(cli.app, ["set-zone", "--help"])
-
-        # Verify exit code
-        assert result.exit_code == 0
-
-        # Verify help content
-        assert "Set options for one or more zones" in result.stdout
-        assert "--heat" in result.stdout
-        assert "--cool" in result.stdout
-        assert "--temp" in result.stdout
-        assert "--no-temp" in result.stdout
-        assert "--hold" in result.stdout
-        assert "--no-hold" in result.stdout
-        assert "--out" in result.stdout
-        assert "--no-out" in result.stdout
-
-    def test_set_zone_no_hold_clears_hold(self, runner, mock_client, sample_status, monkeypatch):
-        """Test that --no-hold explicitly passes hold=False."""
-        mock_client.set_zone_setpoints.return_value = None
-        mock_client.get_status_data.return_value = sample_status
-
-        async def mock_get_client():
-            return mock_client
-
-        monkeypatch.setattr(cli, "get_client", mock_get_client)
-
-        result = runner.invoke(cli.app, ["set-zone", "1", "--no-hold"])
-
-        assert result.exit_code == 0
-        mock_client.set_zone_setpoints.assert_called_once_with(
-            zones=[1],
-            heat_setpoint=None,
-            cool_setpoint=None,
-            temporary_hold=None,
-            hold=False,
-            out_mode=None,
-        )
 
-    def test_set_zone_no_temp_clears_temp(self, runner, mock_client, sample_status, monkeypatch):
-        """Test that --no-temp explicitly passes temporary_hold=False."""
-        mock_client.set_zone_setpoints.return_value = None
-        mock_client.get_status_data.return_value = sample_status
+@pytest.fixture(scope="module")
+def runner():
+    """Create a CliRunner instance; it keeps no state between invokes."""
+    return CliRunner()
 
-        async def mock_get_client():
-            return mock_client
 
-        monkeypatch.setattr(cli, "get_client", mock_get_client)
+# A recorded client call: (method name, args, kwargs)
+_Call = tuple[str, tuple[Any, ...], dict[str, Any]]
 
-        result = runner.invoke(cli.app, ["set-zone", "1", "--no-temp"])
 
-        assert result.exit_code == 0
-        mock_client.set_zone_setpoints.assert_called_once_with(
-            zones=[1],
-            heat_setpoint=None,
-            cool_setpoint=None,
-            temporary_hold=False,
-            hold=None,
-            out_mode=None,
-        )
+class _FakeClient:
+    """
+    Stand-in for ComfortZoneIIClient with just the methods the CLI calls.
+
+    Each call is recorded in ``calls`` as (name, args, kwargs). ``returns``
+    maps a method name to what it returns; exception instances are raised
+    instead, and unset methods return None.
+    """
+
+    __slots__ = ("calls", "returns")
+
+    def __init__(self) -> None:
+        self.calls: list[_Call] = []
+        self.returns: dict[str, Any] = {}
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.returns.clear()
+
+    def _call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((name, args, kwargs))
+        result = self.returns.get(name)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def connection(self) -> AbstractAsyncContextManager[None]:
+        self._call("connection")
+        return nullcontext()
+
+    async def get_status_data(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("get_status_data", *args, **kwargs)
+
+    async def set_system_mode(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("set_system_mode", *args, **kwargs)
+
+    async def set_fan_mode(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("set_fan_mode", *args, **kwargs)
+
+    async def set_zone_setpoints(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("set_zone_setpoints", *args, **kwargs)
+
+    async def read_row(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("read_row", *args, **kwargs)
+
+    def monitor_bus(self) -> Any:
+        return self._call("monitor_bus")
 
-    def test_set_zone_invalid_temperature(self, runner):
-        """Test set-zone command with invalid temperature values."""
-        # Test with heat setpoint too low
-        result = runner.invoke(cli.app, ["set-zone", "1", "--heat", "30"])
-        
-        # Should fail due to validation (though this depends on Typer's validation)
-        # The exact exit code may vary, but it should not be 0
-        assert result.exit_code != 0
-
-    def test_set_zone_missing_zones(self, runner):
-        """Test set-zone command without specifying zones."""
-        result = runner.invoke(cli.app, ["set-zone", "--heat", "70"])
-        
-        # Should fail because zones argument is required
-        assert result.exit_code == 2
-
-    def test_client_connection_error(self, runner, mock_client, monkeypatch):
-        """Test command execution when client connection fails."""
-        # Configure mock to raise exception during connection
-        mock_client.connection.side_effect = Exception("Connection failed")
-        
-        # Patch the get_client function
-        async def mock_get_client():
-            return mock_client
-        
-        monkeypatch.setattr(cli, "get_client", mock_get_client)
-        
-        # Run command
-        result = runner.invoke(cli.app, ["status"])
-        
-        # Verify exit code indicates failure
-        assert result.exit_code != 0
-
-    def test_no_args_shows_help(self, runner):
-        """Test that running CLI with no arguments shows help."""
-        result = runner.invoke(cli.app, [])
-        
-        # Verify that help is shown (exit code 0 for help display)
-        assert result.exit_code == 0
-        assert "Usage:" in result.stdout
-        assert "Command-Line Interface for interacting with the HVAC system" in result.stdout
+    def assert_called_once(self, name: str) -> None:
+        count = sum(1 for call in self.calls if call[0] == name)
+        assert count == 1, f"{name} called {count} times"
+
+    def assert_called_once_with(self, name: str, *args: Any, **kwargs: Any) -> None:
+        calls = [call for call in self.calls if call[0] == name]
+        assert calls == [(name, args, kwargs)]
+
+
+@pytest.fixture(scope="module")
+def fake_client():
+    """Create a fake ComfortZoneIIClient, shared by every test in the module."""
+    return _FakeClient()
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake_client(fake_client):
+    """Drop return values and calls left by the previous test."""
+    fake_client.reset()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_get_client(fake_client):
+    """Point every command at the shared fake client, once for the module."""
+
+    async def _get_client():
+        return fake_client
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cli, "get_client", _get_client)
+        yield
+
+
+_RAW_BLOB = "QUJD"
+
+
+@pytest.fixture(scope="module")
+def sample_status():
+    """
+    Create a sample SystemStatus object for testing.
+
+    Shared across the module; tests that need a variant use model_copy().
+    The values are known-good, so validation is skipped.
+    """
+    zones = [
+        ZoneStatus.model_construct(
+            zone_id=1,
+            temperature=72,
+            damper_position=75,
+            cool_setpoint=74,
+            heat_setpoint=68,
+            temporary=False,
+            hold=False,
+            out=False
+        ),
+        ZoneStatus.model_construct(
+            zone_id=2,
+            temperature=70,
+            damper_position=50,
+            cool_setpoint=76,
+            heat_setpoint=66,
+            temporary=True,
+            hold=False,
+            out=False
+        ),
+        ZoneStatus.model_construct(
+            zone_id=3,
+            temperature=68,
+            damper_position=25,
+            cool_setpoint=72,
+            heat_setpoint=64,
+            temporary=False,
+            hold=True,
+            out=False
+        ),
+        ZoneStatus.model_construct(
+            zone_id=4,
+            temperature=0,
+            damper_position=0,
+            cool_setpoint=72,
+            heat_setpoint=64,
+            temporary=False,
+            hold=False,
+            out=True
+        )
+    ]
+
+    return SystemStatus.model_construct(
+        system_time="Mon 02:30pm",
+        system_mode=SystemMode.AUTO,
+        effective_mode=SystemMode.COOL,
+        fan_mode=FanMode.AUTO,
+        fan_state="On",
+        active_state="Cool On",
+        all_mode=False,
+        outside_temp=85,
+        air_handler_temp=65,
+        zone1_humidity=45,
+        compressor_stage_1=False,
+        compressor_stage_2=False,
+        aux_heat_stage_1=False,
+        aux_heat_stage_2=False,
+        humidify=False,
+        dehumidify=False,
+        reversing_valve=False,
+        raw=None,
+        zones=zones
+    )
+
+
+# What `status` prints for sample_status
+_STATUS_NEEDLES = (
+    # Key content
+    "System Time:",
+    "Mon 02:30pm",
+    "Outside 85°F",
+    "Indoor humidity 45%",
+    "65°F, Fan On, Cool On",
+    "Auto (Cool), Fan Auto",
+    # Zone table headers
+    "Zone",
+    "Temp (°F)",
+    "Damper (%)",
+    "Setpoint",
+    "Mode",
+    # Zone data
+    "Zone 1",
+    "Zone 2",
+    "Zone 3",
+    "Zone 4",
+    "72",  # Zone 1 temperature
+    "70",  # Zone 2 temperature
+    "[TEMP]",  # Zone 2 temporary mode
+    "[HOLD]",  # Zone 3 hold mode
+    "OUT",  # Zone 4 out mode
+)
+
+
+def _call(name: str, *args: Any, **kwargs: Any) -> _Call:
+    """A call as _FakeClient records it."""
+    return (name, args, kwargs)
+
+
+def _set_zone_call(zones: list[int], **kwargs: Any) -> _Call:
+    """A set_zone_setpoints call; options the command didn't get are None."""
+    options = dict.fromkeys(
+        ("heat_setpoint", "cool_setpoint", "temporary_hold", "hold", "out_mode")
+    )
+    return _call("set_zone_setpoints", zones=zones, **(options | kwargs))
+
+
+async def _yield_frames(frames: Iterable[Any]) -> AsyncIterator[Any]:
+    """Stand-in for monitor_bus(): yield the given frames, then stop."""
+    for frame in frames:
+        yield frame
+
+
+def _assert_all_in(text: str, needles: Iterable[str]) -> None:
+    """Assert every needle occurs in text, reporting all that are missing."""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing from output: {missing}"
+
+
+def _invoke_fast(argv: list[str]) -> tuple[int, str]:
+    """
+    Run the app in-process, without CliRunner's stdio capture, and return
+    (exit code, error message). With standalone_mode=False usage errors
+    are raised instead of printed, and typer.Exit becomes the return value.
+    """
+    command = _get_command(cli.app)
+    try:
+        return command.main(argv, standalone_mode=False) or 0, ""
+    except TyperException as e:
+        return e.exit_code, e.format_message()
+
+
+@pytest.fixture(scope="module")
+def sample_status_with_raw(sample_status):
+    """sample_status carrying a raw frame blob, as with include_raw=True."""
+    return sample_status.model_copy(update={"raw": _RAW_BLOB})
+
+
+@pytest.mark.parametrize(
+    "argv, expected_calls, needles",
+    [
+        pytest.param(
+            ["status"],
+            [_call("get_status_data")],
+            _STATUS_NEEDLES,
+            id="status",
+        ),
+        pytest.param(
+            ["set-system", "--mode", "Heat", "--fan", "On", "--all"],
+            [
+                _call("set_system_mode", SystemMode.HEAT, True),
+                _call("set_fan_mode", FanMode.ON),
+                _call("get_status_data"),
+            ],
+            ("System settings updated", "New status:", "System Time:"),
+            id="set-system",
+        ),
+        pytest.param(
+            ["set-zone", "1", "3", "--heat", "70", "--cool", "76", "--temp"],
+            [
+                _set_zone_call(
+                    [1, 3], heat_setpoint=70, cool_setpoint=76, temporary_hold=True
+                ),
+                _call("get_status_data"),
+            ],
+            ("Zone settings updated", "New status:", "System Time:"),
+            id="set-zone",
+        ),
+        pytest.param(
+            ["set-zone", "2", "--heat", "68", "--hold", "--out"],
+            [
+                _set_zone_call([2], heat_setpoint=68, hold=True, out_mode=True),
+                _call("get_status_data"),
+            ],
+            (),
+            id="set-zone-single-zone",
+        ),
+        # --no-hold / --no-temp pass an explicit False, not None
+        pytest.param(
+            ["set-zone", "1", "--no-hold"],
+            [_set_zone_call([1], hold=False), _call("get_status_data")],
+            (),
+            id="set-zone-no-hold",
+        ),
+        pytest.param(
+            ["set-zone", "1", "--no-temp"],
+            [_set_zone_call([1], temporary_hold=False), _call("get_status_data")],
+            (),
+            id="set-zone-no-temp",
+        ),
+    ],
+)
+def test_success_path(
+    runner, fake_client, sample_status, argv, expected_calls, needles
+):
+    """Test a successful command: client calls made and output printed."""
+    # Configure the fake
+    fake_client.returns["get_status_data"] = sample_status
+
+    # Run command
+    result = runner.invoke(cli.app, argv)
+
+    # Verify exit code and output
+    assert result.exit_code == 0
+    _assert_all_in(result.stdout, needles)
+
+    # Verify the client calls, in order, inside one connection
+    assert fake_client.calls == [_call("connection"), *expected_calls]
+
+
+@pytest.mark.parametrize("raw", [False, True], ids=["plain", "raw"])
+def test_status_json_command(
+    runner, fake_client, sample_status, sample_status_with_raw, raw
+):
+    """Test status-json output, with and without the raw frame blob."""
+    # Configure the fake
+    fake_client.returns["get_status_data"] = (
+        sample_status_with_raw if raw else sample_status
+    )
+
+    # Run command
+    argv = ["status-json", "--raw"] if raw else ["status-json"]
+    result = runner.invoke(cli.app, argv)
+
+    # Verify exit code
+    assert result.exit_code == 0
+
+    # Verify JSON content, parsed once
+    data = orjson.loads(result.stdout)
+    assert data["system_time"] == "Mon 02:30pm"
+    assert data["system_mode"] == "Auto"
+    assert data["outside_temp"] == 85
+    assert len(data["zones"]) == 4
+    if raw:
+        assert data["raw"] == _RAW_BLOB
+    else:
+        assert "raw" not in data
+
+    # Verify the client was asked for raw data only with --raw
+    fake_client.assert_called_once_with("get_status_data", include_raw=raw)
+
+
+def test_status_command_failure(runner, fake_client):
+    """Test status command with client failure."""
+    # Configure mock to raise TimeoutError (no more Tenacity wrapper)
+    error = TimeoutError("No valid reply received.")
+    fake_client.returns["get_status_data"] = error
+    
+    # Run command
+    result = runner.invoke(cli.app, ["status"])
+    
+    # Verify exit code indicates failure, from the client's own error
+    assert result.exit_code != 0
+    assert result.exception is error
+    
+    # Verify mock was called, with no retries
+    fake_client.assert_called_once("get_status_data")
+
+
+def test_set_system_command_no_options(runner, fake_client):
+    """Test set-system command with no options specified."""
+    # Run command with no options
+    result = runner.invoke(cli.app, ["set-system"])
+    
+    # Verify exit code indicates failure
+    assert result.exit_code == 1
+    
+    # Verify error message
+    assert "No options specified" in result.stdout
+
+    # The client is never reached
+    assert not fake_client.calls
+
+
+def test_set_system_command_invalid_mode():
+    """Test set-system command with invalid mode."""
+    # Run command with invalid mode
+    exit_code, message = _invoke_fast(["set-system", "--mode", "invalid-mode"])
+
+    # Verify exit code indicates validation error
+    assert exit_code == 2
+
+    # Verify error message contains information about invalid choice
+    assert "invalid-mode" in message
+
+
+def test_read_command_success(runner, fake_client):
+    """Test successful read command execution."""
+    # Only the reply's data is printed
+    frame = SimpleNamespace(data=[0, 1, 16, 74, 74, 68, 68])
+
+    # Configure mock
+    fake_client.returns["read_row"] = frame
+    
+    # Run command
+    result = runner.invoke(cli.app, ["read", "1", "1", "16"])
+    
+    # Verify exit code
+    assert result.exit_code == 0
+    
+    # Verify output contains the frame data
+    assert "0.1.16.74.74.68.68" in result.stdout
+    
+    # Verify mock was called with correct arguments
+    fake_client.assert_called_once_with("read_row", 1, 1, 16)
+
+
+def test_monitor_command_setup(runner, fake_client):
+    """Test monitor command setup (without actually monitoring)."""
+    # Configure mock: one frame, then the bus ends (no infinite loop in test)
+    fake_client.returns["monitor_bus"] = _yield_frames(
+        [
+            SimpleNamespace(
+                source=1,
+                destination=9,
+                function=SimpleNamespace(name="read"),
+                data=[0, 1, 16],
+            )
+        ]
+    )
+    
+    # Run command (this will run until the generator is exhausted)
+    result = runner.invoke(cli.app, ["monitor"])
+    
+    # Verify exit code
+    assert result.exit_code == 0
+    
+    # Verify monitoring setup message and frame output format
+    _assert_all_in(
+        result.stdout, ("Monitoring bus traffic", "01 -> 09", "read", "0.1.16")
+    )
+
+
+def test_invalid_command():
+    """Test execution of non-existent command."""
+    exit_code, message = _invoke_fast(["nonexistent"])
+
+    # Verify exit code indicates command not found
+    assert exit_code == 2
+
+    # Verify error message
+    assert "No such command" in message
+
+
+@pytest.mark.parametrize(
+    "path, needles",
+    [
+        pytest.param(
+            (),
+            (
+                "Command-Line Interface for interacting with the HVAC system",
+                "status",
+                "set-system",
+                "set-zone",
+                "monitor",
+                "read",
+            ),
+            id="app",
+        ),
+        pytest.param(
+            ("status",),
+            ("Print an overview of the current system status",),
+            id="status",
+        ),
+        pytest.param(
+            ("set-zone",),
+            (
+                "Set options for one or more zones",
+                "--heat",
+                "--cool",
+                "--temp",
+                "--no-temp",
+                "--hold",
+                "--no-hold",
+                "--out",
+                "--no-out",
+            ),
+            id="set-zone",
+        ),
+    ],
+)
+def test_help_output(runner, path, needles):
+    """Test help output for the app and its commands."""
+    result = runner.invoke(cli.app, [*path, "--help"])
+
+    # Verify exit code
+    assert result.exit_code == 0
+
+    # Verify help content
+    _assert_all_in(result.stdout, needles)
+
+
+def test_set_zone_invalid_temperature():
+    """Test set-zone command with invalid temperature values."""
+    # Test with heat setpoint too low
+    exit_code, _ = _invoke_fast(["set-zone", "1", "--heat", "30"])
+
+    # Should fail due to validation (though this depends on Typer's validation)
+    # The exact exit code may vary, but it should not be 0
+    assert exit_code != 0
+
+
+def test_set_zone_missing_zones():
+    """Test set-zone command without specifying zones."""
+    exit_code, _ = _invoke_fast(["set-zone", "--heat", "70"])
+
+    # Should fail because zones argument is required
+    assert exit_code == 2
+
+
+def test_client_connection_error(runner, fake_client):
+    """Test command execution when client connection fails."""
+    # Configure mock to raise exception during connection
+    error = Exception("Connection failed")
+    fake_client.returns["connection"] = error
+    
+    # Run command
+    result = runner.invoke(cli.app, ["status"])
+    
+    # Verify exit code indicates failure, before any status read
+    assert result.exit_code != 0
+    assert result.exception is error
+    assert fake_client.calls == [_call("connection")]
+
+
+def test_no_args_shows_help(runner):
+    """Test that running CLI with no arguments shows help."""
+    result = runner.invoke(cli.app, [])
+    
+    # Verify that help is shown (exit code 0 for help display)
+    assert result.exit_code == 0
+    _assert_all_in(
+        result.stdout,
+        ("Usage:", "Command-Line Interface for interacting with the HVAC system"),
+    )
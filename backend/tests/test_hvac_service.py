@@ -101,6 +101,36 @@ class TestExecuteCommandLockTimeout:
                 )
 
 
+class TestExecuteCommandDispatch:
+    """Operations are resolved from a dispatch table before touching the bus."""
+
+    async def test_set_zone_setpoints_forwards_only_given_options(self, sample_status):
+        service = HVACService()
+        service._op_lock = asyncio.Lock()
+        mock_client = _make_mock_client()
+        mock_client.get_status_data.return_value = sample_status
+
+        with patch("pycz2.hvac_service.get_client", return_value=mock_client):
+            await service.execute_command(
+                "set_zone_setpoints", zones=[1], heat_setpoint=68, hold=None,
+            )
+
+        mock_client.set_zone_setpoints.assert_awaited_once_with(
+            zones=[1], heat_setpoint=68,
+        )
+
+    async def test_unknown_operation_raises_without_lock(self):
+        service = HVACService()
+        service._op_lock = asyncio.Lock()
+
+        with patch("pycz2.hvac_service.get_client") as mock_get_client:
+            with pytest.raises(ValueError, match="Unknown operation"):
+                await service.execute_command("reboot")
+
+        mock_get_client.assert_not_called()
+        assert not service._op_lock.locked()
+
+
 class TestRefreshLoop:
     """Finding #18: _refresh_loop should use max(interval, backoff) not additive."""
 
@@ -173,3 +203,44 @@ class TestRefreshOnceTimeout:
             )
             # Should have logged error and returned cache state
             assert service._consecutive_errors == 1
+
+
+class TestSharedRefresh:
+    """Concurrent reads of a stale cache share a single bus refresh."""
+
+    async def test_concurrent_stale_reads_refresh_once(self, tmp_path, sample_status):
+        from pycz2.cache import StateCache
+
+        service = HVACService()
+        service._op_lock = asyncio.Lock()
+        service._cache = StateCache(db_path=tmp_path / "cache.db")
+        await service._cache.initialize()
+
+        mock_client = _make_mock_client()
+
+        async def slow_get(**kw):
+            await asyncio.sleep(0.05)
+            return sample_status
+        mock_client.get_status_data.side_effect = slow_get
+
+        with patch("pycz2.hvac_service.get_client", return_value=mock_client):
+            results = await asyncio.gather(
+                *(service.get_status() for _ in range(5))
+            )
+
+        assert mock_client.get_status_data.await_count == 1
+        assert all(status.system_time == "Mon 02:30pm" for status, _ in results)
+        assert service._refresh_future is None
+
+
+class TestStop:
+    """stop() must not leak the refresh task's CancelledError."""
+
+    async def test_stop_during_initial_delay(self):
+        service = HVACService()
+        await service.start()
+        await asyncio.sleep(0)  # let the loop enter its initial sleep
+
+        await service.stop()
+
+        assert service._refresh_task is None